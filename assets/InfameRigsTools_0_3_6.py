@@ -10,7 +10,23 @@ bl_info = {
 
 import bpy
 import blf
+import gpu
+from gpu_extras.batch import batch_for_shader
+from mathutils import Vector, kdtree
+from bpy.app.handlers import persistent
 import re
+import ast
+import math
+import random
+import csv
+import json
+import cProfile
+import pstats
+import collections
+import time
+import functools
+import fnmatch
+import numpy as np
 
 # ---- Helper Functions ----
 
@@ -51,6 +67,33 @@ class InfameRigToolsProperties(bpy.types.PropertyGroup):
         description="Show/hide viewport display options",
         default=True
     )
+    performance_scope: bpy.props.EnumProperty(
+        name="Scope",
+        description="Objects switched by Performance Display",
+        items=[('SCENE', "Scene", "Every armature and mesh in the scene"), ('COLLECTION', "Collection", "Armatures and meshes in the chosen collection and its children")],
+        default='SCENE'
+    )
+    performance_collection: bpy.props.PointerProperty(
+        name="Collection",
+        description="Collection switched by Performance Display",
+        type=bpy.types.Collection
+    )
+    show_driver_tools: bpy.props.BoolProperty(
+        name="Driver Tools",
+        description="Show/hide driver tools",
+        default=True
+    )
+    driver_scope: bpy.props.EnumProperty(
+        name="Scope",
+        description="Which drivers the sidebar batch driver tools act on",
+        items=[('OBJECTS', "Selected Objects", "Drivers on the selected objects"), ('ARMATURE', "Active Armature", "Drivers on the active armature"), ('FILE', "Whole File", "Every driver in the file")],
+        default='ARMATURE'
+    )
+    driver_path_filter: bpy.props.StringProperty(
+        name="Path Filter",
+        description="Data path pattern for whole-file driver operations (e.g. *smile*)",
+        default="*"
+    )
     show_parenting_tools: bpy.props.BoolProperty(
         name="Parenting",
         description="Show/hide parenting tools",
@@ -59,6 +102,8 @@ class InfameRigToolsProperties(bpy.types.PropertyGroup):
 
 # ---- Renaming Operators ----
 
+_KNOWN_PREFIXES = ("DEF_", "CTRL_", "ORG_", "MECH_")
+
 class INFAME_OT_sync_names(bpy.types.Operator):
     bl_idname = "infame.sync_names"; bl_label = "Sync from Selection"; bl_description = "Sync object and bone name from current selection"
     def execute(self, context):
@@ -98,7 +143,7 @@ class INFAME_OT_set_prefix(bpy.types.Operator):
     def execute(self, context):
         props = context.scene.infame_rig_tools
         name = props.rename_base or props.bone_name
-        for p in ["DEF_", "CTRL_", "ORG_", "MECH_"]:
+        for p in _KNOWN_PREFIXES:
             if name.upper().startswith(p):
                 name = name[len(p):]
         props.rename_base = name
@@ -124,9 +169,7 @@ class INFAME_OT_set_suffix(bpy.types.Operator):
     def execute(self, context):
         props = context.scene.infame_rig_tools
         name = props.rename_base or props.bone_name
-        for s in ["_L", "_R"]:
-            if name.upper().endswith(s):
-                name = name[:-len(s)]
+        name = _SIDE_END_RE.sub("", name)
         props.rename_base = name
         props.rename_suffix = self.suffix
         update_bone_name_from_parts(props)
@@ -142,6 +185,131 @@ class INFAME_OT_clear_suffix(bpy.types.Operator):
         update_bone_name_from_parts(props)
         return {'FINISHED'}
 
+def compose_name(name, prefix="", suffix="", find="", replace=""):
+    # Same rules as the prefix/suffix buttons: a new prefix replaces known prefixes, a new suffix replaces the side marker.
+    base = name
+    if prefix:
+        for p in _KNOWN_PREFIXES:
+            if base.upper().startswith(p): base = base[len(p):]
+    if suffix: base = _SIDE_END_RE.sub("", base)
+    if find: base = base.replace(find, replace)
+    return f"{prefix}{base}{suffix}"
+
+def filter_renames(names, changes, linked=None):
+    # changes maps old -> new and is trimmed in place; returns how many renames were dropped.
+    # A rename is dropped when its target is held by a name that stays (an item not being renamed, or one whose
+    # rename was dropped) or claimed by an earlier rename. Dropping one can invalidate another, so repeat until
+    # nothing changes. linked maps an old name to a partner whose rename is dropped together with it.
+    skipped = 0
+    while True:
+        kept = set(names) - set(changes); claimed = set(); dropped = set()
+        for old, new in changes.items():
+            if new in claimed or new in kept: dropped.add(old)
+            else: claimed.add(new)
+        if linked: dropped |= {linked[old] for old in dropped if old in linked and linked[old] in changes}
+        if not dropped: return skipped
+        for old in dropped: del changes[old]
+        skipped += len(dropped)
+
+def apply_renames(items, changes, linked=None):
+    # items maps every name in the namespace to its datablock. Colliding renames are dropped by filter_renames.
+    skipped = filter_renames(items, changes, linked)
+    # Items whose new name is still held by another renamed item go through a temporary name first.
+    targets = set(changes.values())
+    for k, old in enumerate([old for old in changes if old in targets]): items[old].name = f"__rename_{k}"
+    for old, new in changes.items(): items[old].name = new
+    return skipped
+
+_NAMED_REF_RE = re.compile(r'\b(bones|objects)\["((?:[^"\\]|\\.)*)"\]')
+
+class NameReferenceIndex:
+    # Reverse index of every place in bpy.data that refers to a bone or object by name: driver bone targets,
+    # bones["..."] / objects["..."] inside driver and target data paths, and constraint subtargets.
+    # Bone references are keyed by the armature object or data they belong to, object references by name only.
+    def __init__(self):
+        self.refs = {}; self.paths = {}
+    def add(self, owner, collection, name, kind, rna, attr):
+        key = (owner.as_pointer() if collection == "bones" else 0, collection, name)
+        self.refs.setdefault(key, []).append((kind, rna, attr))
+    def add_path(self, owner, rna, attr):
+        path = self.paths.setdefault((rna.as_pointer(), attr), getattr(rna, attr))
+        for collection, name in _NAMED_REF_RE.findall(path): self.add(owner, collection, name, 'PATH', rna, attr)
+    def build(self):
+        for owner, fc in iter_file_drivers():
+            self.add_path(owner, fc, "data_path")
+            if not fc.driver: continue
+            for var in fc.driver.variables:
+                for target in var.targets:
+                    if target.id is None: continue
+                    if target.bone_target: self.add(target.id, "bones", target.bone_target, 'NAME', target, "bone_target")
+                    if var.type == 'SINGLE_PROP' and target.data_path: self.add_path(target.id, target, "data_path")
+        for obj in bpy.data.objects:
+            constraints = list(obj.constraints)
+            if obj.pose:
+                for pbone in obj.pose.bones: constraints.extend(pbone.constraints)
+            for con in constraints:
+                for target_attr, sub_attr in (("target", "subtarget"), ("pole_target", "pole_subtarget")):
+                    target = getattr(con, target_attr, None); name = getattr(con, sub_attr, "")
+                    if target is not None and name: self.add(target, "bones", name, 'NAME', con, sub_attr)
+        return self
+    def rewrite(self, owners, collection, renames):
+        # Blender may already have fixed some references during the rename, so every write is checked first:
+        # names against the old name, paths against the path recorded by build().
+        done = set(); count = 0
+        keys = [o.as_pointer() for o in owners] if collection == "bones" else [0]
+        for key in keys:
+            for old, new in renames.items():
+                for kind, rna, attr in self.refs.get((key, collection, old), ()):
+                    if kind == 'NAME':
+                        if getattr(rna, attr) == old: setattr(rna, attr, new); count += 1
+                        continue
+                    ref = (rna.as_pointer(), attr)
+                    if ref in done: continue
+                    done.add(ref)
+                    path = self.paths[ref]
+                    if getattr(rna, attr) != path: continue
+                    new_path = _NAMED_REF_RE.sub(lambda m: f'{m.group(1)}["{renames.get(m.group(2), m.group(2))}"]' if m.group(1) == collection else m.group(0), path)
+                    if new_path != path: setattr(rna, attr, new_path); self.paths[ref] = new_path; count += 1
+        return count
+
+def rename_datablocks(items, rename, index=None):
+    """Rename objects, pose bones or edit bones with rename(old_name) -> new_name (empty or equal keeps the name)
+    and update every driver and constraint reference. Returns (renamed, rewritten, skipped)."""
+    groups = {}
+    for item in items: groups.setdefault(None if isinstance(item, bpy.types.Object) else item.id_data, []).append(item)
+    index = index or NameReferenceIndex().build()
+    renamed = skipped = rewritten = 0
+    for owner, group in groups.items():
+        changes = {item.name: rename(item.name) for item in group}
+        changes = {old: new for old, new in changes.items() if new and new != old}
+        if owner is None: namespace = {o.name: o for o in bpy.data.objects}; owners = []; collection = "objects"
+        elif isinstance(group[0], bpy.types.EditBone):
+            namespace = {b.name: b for b in owner.edit_bones}; owners = [owner] + [o for o in bpy.data.objects if o.data == owner]; collection = "bones"
+        else:
+            namespace = {pb.name: pb for pb in owner.pose.bones}; owners = [owner, owner.data]; collection = "bones"
+        skipped += apply_renames(namespace, changes); renamed += len(changes)
+        rewritten += index.rewrite(owners, collection, changes)
+    if rewritten: invalidate_driver_index()
+    return renamed, rewritten, skipped
+
+class INFAME_OT_batch_rename(bpy.types.Operator):
+    bl_idname = "infame.batch_rename"; bl_label = "Batch Rename Selected"; bl_description = "Apply prefix/suffix/replace rules to all selected bones or objects and update drivers and constraints that refer to them"; bl_options = {'REGISTER', 'UNDO'}
+    prefix: bpy.props.StringProperty(name="Prefix", description="New prefix, replaces DEF_/CTRL_/ORG_/MECH_ (empty keeps the current one)")
+    suffix: bpy.props.StringProperty(name="Suffix", description="New suffix, replaces the side marker (empty keeps the current one)")
+    find: bpy.props.StringProperty(name="Find", description="Text to replace in the base name")
+    replace: bpy.props.StringProperty(name="Replace", description="Replacement text")
+    def invoke(self, context, event):
+        props = context.scene.infame_rig_tools; self.prefix = props.rename_prefix; self.suffix = props.rename_suffix
+        return context.window_manager.invoke_props_dialog(self)
+    def execute(self, context):
+        if context.mode == 'EDIT_ARMATURE': selected = context.selected_editable_bones or []
+        elif context.mode == 'POSE': selected = context.selected_pose_bones or []
+        else: selected = context.selected_objects
+        if not selected: self.report({'WARNING'}, "Nothing selected"); return {'CANCELLED'}
+        renamed, rewritten, skipped = rename_datablocks(selected, lambda name: compose_name(name, self.prefix, self.suffix, self.find, self.replace))
+        self.report({'WARNING'} if skipped else {'INFO'}, f"{renamed} renamed, {rewritten} references updated, {skipped} name conflicts")
+        return {'FINISHED'}
+
 # ---- Viewport Display Operators ----
 
 class INFAME_OT_toggle_in_front(bpy.types.Operator):
@@ -174,165 +342,983 @@ class INFAME_OT_set_armature_display(bpy.types.Operator):
         if obj and obj.type == 'ARMATURE': obj.data.display_type = self.type
         return {'FINISHED'}
 
+# Cheap display state per datablock kind; attributes missing in the running Blender version are skipped.
+_PERFORMANCE_DISPLAY = {
+    'ARMATURE': {"display_type": 'STICK', "show_bone_custom_shapes": False, "show_axes": False, "show_names": False},
+    'MESH': {"show_wire": False},
+    'HELPER': {"display_type": 'WIRE', "show_wire": False},
+}
+_PERFORMANCE_STATE_KEY = "infame_performance_display"
+
+def performance_display_targets(objects):
+    for obj in objects:
+        if obj.type == 'ARMATURE' and obj.data: yield obj.data, _PERFORMANCE_DISPLAY['ARMATURE']
+        elif obj.type == 'MESH': yield obj, _PERFORMANCE_DISPLAY['HELPER' if obj.hide_render else 'MESH']
+
+def apply_performance_display(objects):
+    # Only values that actually change are stored, keyed by ID type and name.
+    state = {}
+    for id_data, settings in performance_display_targets(objects):
+        if id_data.library: continue
+        changed = {}
+        for attr, value in settings.items():
+            if hasattr(id_data, attr) and getattr(id_data, attr) != value:
+                changed[attr] = getattr(id_data, attr); setattr(id_data, attr, value)
+        if changed: state.setdefault(type(id_data).__name__, {})[id_data.name] = changed
+    return state
+
+def restore_performance_display(state):
+    restored = 0
+    for type_name, entries in state.items():
+        collection = bpy.data.armatures if type_name == "Armature" else bpy.data.objects
+        for name, changed in entries.items():
+            id_data = collection.get(name)
+            if id_data is None: continue
+            for attr, value in changed.items(): setattr(id_data, attr, value)
+            restored += 1
+    return restored
+
+class INFAME_OT_performance_display(bpy.types.Operator):
+    bl_idname = "infame.performance_display"; bl_label = "Performance Display"; bl_description = "Switch every armature and mesh in the scene or collection to a cheap display state, or restore the previous one"; bl_options = {'REGISTER', 'UNDO'}
+    def execute(self, context):
+        scene = context.scene; props = scene.infame_rig_tools
+        if _PERFORMANCE_STATE_KEY in scene:
+            restored = restore_performance_display(scene[_PERFORMANCE_STATE_KEY].to_dict())
+            del scene[_PERFORMANCE_STATE_KEY]
+            self.report({'INFO'}, f"Display restored on {restored} datablocks"); return {'FINISHED'}
+        if props.performance_scope == 'COLLECTION':
+            if not props.performance_collection: self.report({'WARNING'}, "Choose a collection"); return {'CANCELLED'}
+            objects = props.performance_collection.all_objects
+        else: objects = scene.objects
+        state = apply_performance_display(objects)
+        if not state: self.report({'INFO'}, "Display already in performance state"); return {'CANCELLED'}
+        scene[_PERFORMANCE_STATE_KEY] = state
+        self.report({'INFO'}, f"Performance display on {sum(len(entries) for entries in state.values())} datablocks")
+        return {'FINISHED'}
+
 # ---- Driver Operators ----
 
+# Per-ID data_path -> driver F-curve index. Python references to F-curves do not survive undo or
+# driver removal, so the whole index is dropped on every depsgraph update, undo/redo and file load.
+_driver_index = {}
+
+def invalidate_driver_index(id_data=None):
+    if id_data is None: _driver_index.clear()
+    else: _driver_index.pop(id_data.as_pointer(), None)
+
+@persistent
+def _invalidate_driver_index_handler(*_args):
+    _driver_index.clear()
+
+@persistent
+def _invalidate_updated_driver_index_handler(_scene, depsgraph):
+    # Only the data-blocks touched by this update can have gained or lost drivers.
+    for update in depsgraph.updates:
+        id_data = getattr(update.id, "original", update.id)
+        if id_data is not None: invalidate_driver_index(id_data)
+
+_DRIVER_INDEX_HANDLERS = ("undo_post", "redo_post", "load_post")
+
+def find_driver_fcurve(id_data, path, array_index=None):
+    key = id_data.as_pointer()
+    index = _driver_index.get(key)
+    if index is None:
+        index = _driver_index[key] = {}
+        anim = getattr(id_data, "animation_data", None)
+        if anim:
+            for fc in anim.drivers:
+                index.setdefault((fc.data_path, fc.array_index), fc)
+                index.setdefault((fc.data_path, None), fc)
+    return index.get((path, array_index))
+
+def get_button_array_index(context):
+    # context.property carries the hovered array element; older builds only expose button_prop.
+    prop = getattr(context, "property", None)
+    if prop and len(prop) > 2 and prop[2] >= 0: return prop[2]
+    button_prop = getattr(context, "button_prop", None)
+    if button_prop is not None and not getattr(button_prop, "is_array", False): return 0
+    return None
+
 def get_driver_fcurve_from_context(context):
-    obj = context.active_object
-    if not obj: return None, "No active object"
-    button_pointer = context.button_pointer
-    button_prop = context.button_prop
+    button_pointer = getattr(context, "button_pointer", None)
+    button_prop = getattr(context, "button_prop", None)
     if not button_pointer or not button_prop: return None, "No UI button context available"
+    id_data = button_pointer.id_data
+    if id_data is None: return None, "Property has no owner data-block"
     try: path = button_pointer.path_from_id(button_prop.identifier)
     except Exception: return None, "Unable to generate path from context"
-    if obj.animation_data:
-        for fc in obj.animation_data.drivers:
-            if fc.data_path == path: return fc, ""
-    return None, "No driver found on this property"
+    fc = find_driver_fcurve(id_data, path, get_button_array_index(context))
+    if not fc: return None, "No driver found on this property"
+    return fc, ""
+_DRIVER_SCOPE_ITEMS = [
+    ('BUTTON', "Property", "Driver of the property under the mouse"),
+    ('SELECTED', "Selected Drivers", "Selected F-curves in the Drivers editor"),
+    ('OBJECTS', "Selected Objects", "Drivers on the selected objects, their data and shape keys, matching the path filter"),
+    ('ARMATURE', "Active Armature", "Drivers on the active armature object and its data, matching the path filter"),
+    ('FILE', "Whole File", "Every driver in the file whose data path matches the path filter"),
+]
+
+def iter_file_drivers():
+    for coll_name in _ID_TYPE_COLLECTIONS.values():
+        for id_data in getattr(bpy.data, coll_name, ()):
+            for owner in (id_data, getattr(id_data, "node_tree", None)):
+                anim = getattr(owner, "animation_data", None)
+                if anim:
+                    for fc in anim.drivers: yield owner, fc
+
+def find_drivers(objects=None, path_filter="*"):
+    # Context-free: drivers on the objects (their data and shape keys included), or on every ID in the file.
+    source = iter_file_drivers() if objects is None else iter_object_drivers(objects)
+    return [fc for _id_data, fc in source if fnmatch.fnmatchcase(fc.data_path, path_filter or "*")]
+
+def collect_driver_fcurves(context, scope, path_filter="*"):
+    if scope == 'BUTTON':
+        fc, error = get_driver_fcurve_from_context(context)
+        return ([fc] if fc else []), error
+    if scope == 'SELECTED':
+        fcurves = [fc for fc in (getattr(context, "selected_editable_fcurves", None) or []) if fc.driver]
+        return fcurves, "" if fcurves else "No driver F-curves selected in the Drivers editor"
+    if scope == 'OBJECTS': objects = context.selected_objects
+    elif scope == 'ARMATURE':
+        obj = context.active_object
+        if not obj or obj.type != 'ARMATURE': return [], "Active object is not an armature"
+        objects = [obj]
+    else: objects = None
+    fcurves = find_drivers(objects, path_filter)
+    return fcurves, "" if fcurves else f"No drivers match '{path_filter}'"
+
+def invert_fcurve_keys(fcurve, mode):
+    kps = fcurve.keyframe_points; count = len(kps)
+    if not count: return False
+    arrays = []
+    for attr in ("co", "handle_left", "handle_right"):
+        values = np.empty(count * 2, dtype=np.float32); kps.foreach_get(attr, values); arrays.append((attr, values))
+    pivot = 2.0 * arrays[0][1][0::2].mean(dtype=np.float64) if mode == 'CURVE_AVG' else 0.0
+    for attr, values in arrays:
+        values[0::2] = pivot - values[0::2]; kps.foreach_set(attr, values)
+    fcurve.update(); return True
+
 class INFAME_OT_invert_current_driver(bpy.types.Operator):
     bl_idname = "infame.invert_current_driver"; bl_label = "Invert Current Driver"; bl_options = {'REGISTER', 'UNDO'}
     mode: bpy.props.EnumProperty(items=[('CURVE_ZERO', "Curve from Zero", ""), ('CURVE_AVG', "Curve Average", "")], name="Invert Mode")
+    scope: bpy.props.EnumProperty(items=_DRIVER_SCOPE_ITEMS, name="Scope", default='BUTTON')
+    path_filter: bpy.props.StringProperty(name="Path Filter", description="Data path pattern used with the Whole File scope", default="*")
     def execute(self, context):
-        fcurve, error_msg = get_driver_fcurve_from_context(context)
+        fcurves, error_msg = collect_driver_fcurves(context, self.scope, self.path_filter)
         if error_msg: self.report({'WARNING'}, error_msg); return {'CANCELLED'}
-        if not fcurve.keyframe_points: self.report({'WARNING'}, "Driver has no keyframes"); return {'CANCELLED'}
-        if self.mode == 'CURVE_ZERO':
-            for kp in fcurve.keyframe_points: kp.co[0] *= -1; kp.handle_left[0] *= -1; kp.handle_right[0] *= -1
-        elif self.mode == 'CURVE_AVG':
-            xs = [kp.co[0] for kp in fcurve.keyframe_points]
-            if not xs: return {'CANCELLED'}
-            avg_x = sum(xs) / len(xs)
-            for kp in fcurve.keyframe_points: kp.co[0] = 2 * avg_x - kp.co[0]; kp.handle_left[0] = 2 * avg_x - kp.handle_left[0]; kp.handle_right[0] = 2 * avg_x - kp.handle_right[0]
-        fcurve.update(); return {'FINISHED'}
+        inverted = sum(invert_fcurve_keys(fc, self.mode) for fc in fcurves)
+        if not inverted: self.report({'WARNING'}, "Driver has no keyframes"); return {'CANCELLED'}
+        if self.scope != 'BUTTON': self.report({'INFO'}, f"{inverted} drivers inverted")
+        return {'FINISHED'}
+_HANDLE_TYPE_ITEMS = [
+    ('KEEP', "Keep", "Leave handle types unchanged"), ('AUTO_CLAMPED', "Auto Clamped", ""), ('AUTO', "Automatic", ""),
+    ('VECTOR', "Vector", ""), ('ALIGNED', "Aligned", ""), ('FREE', "Free", ""),
+]
+
+def _keyframe_enum_value(prop, identifier):
+    return bpy.types.Keyframe.bl_rna.properties[prop].enum_items[identifier].value
+
+def convert_fcurve_keys(fcurve, interpolation=None, handle_type=None):
+    kps = fcurve.keyframe_points; count = len(kps)
+    if not count: return False
+    if interpolation: kps.foreach_set("interpolation", np.full(count, _keyframe_enum_value("interpolation", interpolation), dtype=np.int32))
+    if handle_type:
+        values = np.full(count, _keyframe_enum_value("handle_left_type", handle_type), dtype=np.int32)
+        kps.foreach_set("handle_left_type", values); kps.foreach_set("handle_right_type", values)
+    fcurve.update(); return True
+
 class INFAME_OT_convert_driver_curve(bpy.types.Operator):
     bl_idname = "infame.convert_driver_curve"; bl_label = "Convert Driver Curve Type"; bl_options = {'REGISTER', 'UNDO'}
-    mode: bpy.props.EnumProperty(items=[('LINEAR', "Linear", ""), ('CONSTANT', "Constant", "")], name="Conversion Mode")
+    mode: bpy.props.EnumProperty(items=[('LINEAR', "Linear", ""), ('CONSTANT', "Constant", ""), ('BEZIER', "Bezier", ""), ('KEEP', "Keep", "Only normalize handle types")], name="Conversion Mode")
+    handle_type: bpy.props.EnumProperty(items=_HANDLE_TYPE_ITEMS, name="Handle Type", default='KEEP')
+    scope: bpy.props.EnumProperty(items=_DRIVER_SCOPE_ITEMS, name="Scope", default='BUTTON')
+    path_filter: bpy.props.StringProperty(name="Path Filter", description="Data path pattern used with batch scopes", default="*")
+    def execute(self, context):
+        fcurves, error_msg = collect_driver_fcurves(context, self.scope, self.path_filter)
+        if error_msg: self.report({'WARNING'}, error_msg); return {'CANCELLED'}
+        interpolation = None if self.mode == 'KEEP' else self.mode
+        handle_type = None if self.handle_type == 'KEEP' else self.handle_type
+        converted = sum(convert_fcurve_keys(fc, interpolation, handle_type) for fc in fcurves)
+        if not converted: self.report({'WARNING'}, "Driver has no keyframes"); return {'CANCELLED'}
+        if self.scope != 'BUTTON': self.report({'INFO'}, f"{converted} drivers converted")
+        return {'FINISHED'}
+
+_KEYFRAME_FLOAT_ATTRS = ("co", "handle_left", "handle_right")
+_KEYFRAME_ENUM_ATTRS = ("interpolation", "handle_left_type", "handle_right_type", "easing", "type")
+
+def _read_keyframes(kps):
+    count = len(kps); data = {}
+    for attr in _KEYFRAME_FLOAT_ATTRS:
+        values = np.empty(count * 2, dtype=np.float32); kps.foreach_get(attr, values); data[attr] = values.reshape(count, 2)
+    for attr in _KEYFRAME_ENUM_ATTRS:
+        values = np.empty(count, dtype=np.int32); kps.foreach_get(attr, values); data[attr] = values
+    return data
+
+def _write_keyframes(fcurve, data, keep=None):
+    kps = fcurve.keyframe_points
+    if keep is not None: data = {attr: values[keep] for attr, values in data.items()}
+    kps.clear(); kps.add(len(data["co"]))
+    for attr, values in data.items(): kps.foreach_set(attr, values.ravel())
+    fcurve.update()
+
+def rdp_keep_mask(x, y, tolerance):
+    # Iterative Ramer-Douglas-Peucker on the value axis: a point is kept when it lies further
+    # than the tolerance from the line between the kept points around it.
+    keep = np.zeros(len(x), dtype=bool); keep[0] = keep[-1] = True
+    stack = [(0, len(x) - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j - i < 2: continue
+        span = x[j] - x[i]
+        t = (x[i + 1:j] - x[i]) / span if span else np.zeros(j - i - 1)
+        error = np.abs(y[i + 1:j] - (y[i] + (y[j] - y[i]) * t))
+        k = int(error.argmax())
+        if error[k] > tolerance:
+            k += i + 1; keep[k] = True; stack.append((i, k)); stack.append((k, j))
+    return keep
+
+def _sample_fcurve(fcurve, xs):
+    return np.fromiter((fcurve.evaluate(x) for x in xs), dtype=np.float64, count=len(xs))
+
+def simplify_fcurve_keys(fcurve, tolerance, handle_type=None, attempts=4):
+    """Drop keyframes while the curve stays within tolerance. Returns (before, after, max_deviation)."""
+    kps = fcurve.keyframe_points; before = len(kps)
+    if before < 3: return before, before, 0.0
+    original = _read_keyframes(kps); data = dict(original)
+    x = data["co"][:, 0].astype(np.float64); y = data["co"][:, 1].astype(np.float64)
+    samples = np.concatenate((x, (x[:-1] + x[1:]) * 0.5))
+    reference = _sample_fcurve(fcurve, samples)
+    if handle_type:
+        data["handle_left_type"] = data["handle_right_type"] = np.full(before, _keyframe_enum_value("handle_left_type", handle_type), dtype=np.int32)
+    # The line test ignores Bezier handles, so tighten and retry until the evaluated curve is within tolerance.
+    threshold = tolerance; written = False
+    for _attempt in range(attempts):
+        keep = rdp_keep_mask(x, y, threshold)
+        if keep.all(): break
+        _write_keyframes(fcurve, data, keep); written = True
+        deviation = float(np.abs(_sample_fcurve(fcurve, samples) - reference).max())
+        if deviation <= tolerance: return before, int(keep.sum()), deviation
+        threshold *= 0.5
+    if written: _write_keyframes(fcurve, original)
+    return before, before, 0.0
+
+class INFAME_OT_simplify_driver_curve(bpy.types.Operator):
+    bl_idname = "infame.simplify_driver_curve"; bl_label = "Simplify Driver Curve"; bl_description = "Remove keyframes from dense driver curves while keeping the curve within a tolerance"; bl_options = {'REGISTER', 'UNDO'}
+    tolerance: bpy.props.FloatProperty(name="Tolerance", description="Maximum allowed change of the driven value", default=0.001, min=0.0, precision=4)
+    handle_type: bpy.props.EnumProperty(items=_HANDLE_TYPE_ITEMS, name="Handle Type", description="Handle type for the kept keyframes; handles of the removed ones no longer fit", default='AUTO_CLAMPED')
+    scope: bpy.props.EnumProperty(items=_DRIVER_SCOPE_ITEMS, name="Scope", default='BUTTON')
+    path_filter: bpy.props.StringProperty(name="Path Filter", description="Data path pattern used with batch scopes", default="*")
     def execute(self, context):
-        fcurve, error_msg = get_driver_fcurve_from_context(context)
+        fcurves, error_msg = collect_driver_fcurves(context, self.scope, self.path_filter)
         if error_msg: self.report({'WARNING'}, error_msg); return {'CANCELLED'}
-        if not fcurve.keyframe_points: self.report({'WARNING'}, "Driver has no keyframes"); return {'CANCELLED'}
-        for kp in fcurve.keyframe_points:
-            if self.mode == 'LINEAR': kp.interpolation = 'LINEAR'
-            elif self.mode == 'CONSTANT': kp.interpolation = 'CONSTANT'
-        fcurve.update(); return {'FINISHED'}
+        handle_type = None if self.handle_type == 'KEEP' else self.handle_type
+        total_before = total_after = simplified = 0; max_deviation = 0.0
+        for fc in fcurves:
+            before, after, deviation = simplify_fcurve_keys(fc, self.tolerance, handle_type)
+            total_before += before; total_after += after; max_deviation = max(max_deviation, deviation); simplified += after < before
+        if not total_before: self.report({'WARNING'}, "Driver has no keyframes"); return {'CANCELLED'}
+        self.report({'INFO'}, f"{simplified}/{len(fcurves)} drivers simplified: {total_before} -> {total_after} keyframes, max deviation {max_deviation:.6f}")
+        return {'FINISHED'}
+
+#----- Driver Expression Optimizer ------------------
+
+# Names and functions accepted by Blender's built-in simple expression evaluator.
+_SIMPLE_FUNCTIONS = frozenset({"radians", "degrees", "abs", "fabs", "floor", "ceil", "trunc", "round", "int", "sin", "cos", "tan", "asin", "acos", "atan", "atan2", "exp", "log", "sqrt", "pow", "fmod", "min", "max", "smoothstep", "lerp", "clamp"})
+_SIMPLE_NAMES = frozenset({"pi", "frame", "True", "False"})
+_INLINE_CONSTANTS = {"e": math.e, "tau": math.tau}
+_SIMPLE_BINOPS = (ast.Add, ast.Sub, ast.Mult, ast.Div)
+
+def _lerp(a, b, t): return a + (b - a) * t
+def _clamp(x, lo=0.0, hi=1.0): return min(max(x, lo), hi)
+def _smoothstep(a, b, x):
+    t = _clamp((x - a) / (b - a)) if b != a else float(x >= b)
+    return t * t * (3.0 - 2.0 * t)
+
+_EXPRESSION_NAMESPACE = {**{k: v for k, v in vars(math).items() if not k.startswith("_")}, "abs": abs, "int": int, "round": round, "min": min, "max": max, "pow": pow, "lerp": _lerp, "clamp": _clamp, "smoothstep": _smoothstep, "True": True, "False": False, "math": math}
+
+class ExpressionNotSimple(Exception):
+    pass
+
+class _SimpleExpressionRewriter(ast.NodeTransformer):
+    def __init__(self, var_names):
+        self.var_names = var_names
+    def generic_visit(self, node):
+        if not isinstance(node, (ast.Expression, ast.BinOp, ast.UnaryOp, ast.BoolOp, ast.Compare, ast.IfExp, ast.Call, ast.Name, ast.Constant, ast.Attribute, ast.Load, ast.operator, ast.unaryop, ast.boolop, ast.cmpop)):
+            raise ExpressionNotSimple(f"unsupported syntax '{type(node).__name__}'")
+        return super().generic_visit(node)
+    def visit_Constant(self, node):
+        if not isinstance(node.value, (int, float)): raise ExpressionNotSimple(f"non-numeric constant {node.value!r}")
+        return node
+    def visit_Name(self, node):
+        if node.id in self.var_names or node.id in _SIMPLE_NAMES or node.id in _SIMPLE_FUNCTIONS: return node
+        if node.id in _INLINE_CONSTANTS: return ast.Constant(_INLINE_CONSTANTS[node.id])
+        raise ExpressionNotSimple(f"unknown name '{node.id}'")
+    def visit_Attribute(self, node):
+        if isinstance(node.value, ast.Name) and node.value.id == "math" and node.value.id not in self.var_names:
+            if node.attr in _SIMPLE_FUNCTIONS or node.attr == "pi": return ast.Name(node.attr, ast.Load())
+            if node.attr in _INLINE_CONSTANTS: return ast.Constant(_INLINE_CONSTANTS[node.attr])
+        raise ExpressionNotSimple(f"attribute access '{ast.unparse(node)}'")
+    def visit_Call(self, node):
+        node = self.generic_visit(node)
+        if not isinstance(node.func, ast.Name) or node.func.id not in _SIMPLE_FUNCTIONS or node.keywords: raise ExpressionNotSimple(f"unsupported call '{ast.unparse(node)}'")
+        return _fold(node)
+    def visit_BinOp(self, node):
+        node = self.generic_visit(node)
+        if isinstance(node.op, ast.Pow): node = ast.Call(ast.Name("pow", ast.Load()), [node.left, node.right], [])
+        elif not isinstance(node.op, _SIMPLE_BINOPS): raise ExpressionNotSimple(f"unsupported operator in '{ast.unparse(node)}'")
+        else:
+            # x*1, 1*x, x/1, x+0, 0+x and x-0 are identities.
+            const = lambda n, v: isinstance(n, ast.Constant) and n.value == v
+            if isinstance(node.op, (ast.Mult, ast.Div)) and const(node.right, 1): return node.left
+            if isinstance(node.op, ast.Mult) and const(node.left, 1): return node.right
+            if isinstance(node.op, (ast.Add, ast.Sub)) and const(node.right, 0): return node.left
+            if isinstance(node.op, ast.Add) and const(node.left, 0): return node.right
+        return _fold(node)
+    def visit_UnaryOp(self, node):
+        return _fold(self.generic_visit(node))
+
+_MAX_FOLD_BITS = 1100  # past float range, so Blender would get inf anyway
+
+def _fold(node):
+    if all(isinstance(n, ast.Constant) for n in ast.iter_child_nodes(node) if isinstance(n, ast.expr) and n is not getattr(node, "func", None)):
+        if isinstance(node, ast.Call) and node.func.id == "pow" and len(node.args) == 2:
+            # Integer powers are exact in Python, so 9**9**9 would never finish evaluating.
+            base, exponent = (arg.value for arg in node.args)
+            if abs(base) > 1 and abs(exponent) * math.log2(abs(base)) > _MAX_FOLD_BITS:
+                raise ExpressionNotSimple(f"constant '{ast.unparse(node)}' is too large")
+        try: return ast.Constant(eval(compile(ast.fix_missing_locations(ast.Expression(node)), "<driver>", "eval"), {"__builtins__": {}}, _EXPRESSION_NAMESPACE))
+        except (ArithmeticError, ValueError, TypeError): pass
+    return node
+
+def _aggregate_type(tree, var_names):
+    # Returns SUM/AVERAGE/MIN/MAX when the expression combines every driver variable exactly once.
+    def terms(node):
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Add): return terms(node.left) + terms(node.right)
+        return [node]
+    def covers(nodes):
+        names = [n.id for n in nodes if isinstance(n, ast.Name)]
+        return len(names) == len(nodes) == len(var_names) >= 2 and set(names) == set(var_names)
+    if isinstance(tree, ast.Call) and isinstance(tree.func, ast.Name) and tree.func.id in ("min", "max") and covers(tree.args): return tree.func.id.upper()
+    if isinstance(tree, ast.BinOp) and isinstance(tree.op, ast.Div) and isinstance(tree.right, ast.Constant) and tree.right.value == len(var_names) and covers(terms(tree.left)): return 'AVERAGE'
+    if covers(terms(tree)): return 'SUM'
+    return 'SCRIPTED'
+
+def optimize_expression(expression, var_names, use_driver_types=True):
+    """Rewrite a driver expression for the simple expression evaluator. Returns (expression, driver_type); raises ExpressionNotSimple."""
+    try: tree = ast.parse(expression.strip(), mode='eval')
+    except SyntaxError as e: raise ExpressionNotSimple(f"syntax error: {e.msg}") from None
+    body = _SimpleExpressionRewriter(frozenset(var_names)).visit(tree).body
+    driver_type = _aggregate_type(body, var_names) if use_driver_types else 'SCRIPTED'
+    return ast.unparse(body), driver_type
+
+def evaluate_expression(expression, driver_type, values, frame=0.0):
+    if driver_type == 'SUM': return sum(values.values())
+    if driver_type == 'AVERAGE': return sum(values.values()) / len(values)
+    if driver_type in ('MIN', 'MAX'): return (min if driver_type == 'MIN' else max)(values.values())
+    return float(eval(expression, {"__builtins__": {}}, {**_EXPRESSION_NAMESPACE, "frame": frame, **values}))
+
+def expressions_equivalent(old, new, new_type, var_names, samples=64, tolerance=1e-5, seed=0):
+    # Samples the original cannot evaluate (domain errors, complex results such as var ** 0.5 on a
+    # negative input, bad calls) are skipped; the rewrite must match on every other sample.
+    rng = random.Random(seed); fixed = [0.0, 1.0, -1.0, 0.5]; compared = 0
+    for i in range(samples):
+        values = {name: fixed[i] if i < len(fixed) else rng.uniform(-2.0, 2.0) for name in var_names}
+        frame = float(rng.randint(-10, 250))
+        try: a = evaluate_expression(old, 'SCRIPTED', values, frame)
+        except (ArithmeticError, ValueError, TypeError): continue
+        try: b = evaluate_expression(new, new_type, values, frame)
+        except (ArithmeticError, ValueError, TypeError): return False
+        if not math.isclose(a, b, rel_tol=tolerance, abs_tol=tolerance): return False
+        compared += 1
+    return compared > 0
+
+def optimize_driver(fc, use_driver_types=True, samples=64, dry_run=False):
+    """Rewrite one driver for the simple expression evaluator. Returns (status, reason), status one of
+    SKIPPED (not scripted), SIMPLE (already fast), REWRITTEN or FAILED."""
+    driver = fc.driver
+    if driver.type != 'SCRIPTED': return 'SKIPPED', ""
+    if driver.use_self: return 'FAILED', "uses self"
+    var_names = [var.name for var in driver.variables]
+    try: expression, driver_type = optimize_expression(driver.expression, var_names, use_driver_types)
+    except ExpressionNotSimple as e: return 'FAILED', str(e)
+    if driver_type == 'SCRIPTED' and driver.is_simple_expression: return 'SIMPLE', ""
+    if driver_type == 'SCRIPTED' and expression == driver.expression.strip(): return 'FAILED', "rejected by the simple expression evaluator"
+    if not expressions_equivalent(driver.expression, expression, driver_type, var_names, samples): return 'FAILED', "rewrite is not equivalent"
+    if dry_run: return 'REWRITTEN', ""
+    old_expression = driver.expression
+    driver.expression = expression; driver.type = driver_type
+    if driver_type == 'SCRIPTED' and not driver.is_simple_expression:
+        driver.expression = old_expression; return 'FAILED', "rejected by the simple expression evaluator"
+    return 'REWRITTEN', ""
+
+class INFAME_OT_optimize_driver_expressions(bpy.types.Operator):
+    bl_idname = "infame.optimize_driver_expressions"; bl_label = "Optimize Driver Expressions"; bl_description = "Rewrite Python driver expressions so Blender evaluates them without the Python interpreter"; bl_options = {'REGISTER', 'UNDO'}
+    scope: bpy.props.EnumProperty(items=_DRIVER_SCOPE_ITEMS, name="Scope", default='BUTTON')
+    path_filter: bpy.props.StringProperty(name="Path Filter", description="Data path pattern used with batch scopes", default="*")
+    use_driver_types: bpy.props.BoolProperty(name="Use Driver Types", description="Turn plain sums, averages, min and max of all variables into Sum/Average/Min/Max drivers", default=True)
+    samples: bpy.props.IntProperty(name="Samples", description="Random inputs used to check the rewritten expression gives the same result", default=64, min=1)
+    dry_run: bpy.props.BoolProperty(name="Dry Run", description="Only report what would change", default=False)
+    def execute(self, context):
+        fcurves, error_msg = collect_driver_fcurves(context, self.scope, self.path_filter)
+        if error_msg: self.report({'WARNING'}, error_msg); return {'CANCELLED'}
+        rewritten = simple = 0; failed = []
+        for fc in fcurves:
+            status, reason = optimize_driver(fc, self.use_driver_types, self.samples, self.dry_run)
+            if status == 'REWRITTEN': rewritten += 1
+            elif status == 'SIMPLE': simple += 1
+            elif status == 'FAILED': failed.append((f"{fc.id_data.name}: {fc.data_path}[{fc.array_index}]", reason))
+        for label, reason in failed: self.report({'WARNING'}, f"Not optimized: {label} ({reason})")
+        if rewritten and not self.dry_run: context.view_layer.update()
+        verb = "can be rewritten" if self.dry_run else "rewritten"
+        self.report({'WARNING'} if failed else {'INFO'}, f"{rewritten} drivers {verb}, {simple} already simple, {len(failed)} not optimizable")
+        return {'FINISHED'}
 
 #----- Flip Drivers ------------------
 
+_SIDE_SWAP = {'l': 'r', 'r': 'l', 'L': 'R', 'R': 'L'}
+_SIDE_ORDER = ('l', 'r', 'L', 'R')
+_SIDE_SUFFIX_RE = re.compile(r'([._-])([lLrR])(?=$|[^a-zA-Z0-9])')
+_SIDE_PREFIX_RE = re.compile(r'^([lLrR])[._-]')
+_SIDE_END_RE = re.compile(r'[._-][lLrR]$')
+_PATH_SPLIT_RE = re.compile(r'([.\[\]"\'])')
+_QUOTED_NAME_RE = re.compile(r'(\["(?:[^"\\]|\\.)*"\])')
+_FLIP_CACHE_SIZE = 8192
+
+@functools.lru_cache(maxsize=_FLIP_CACHE_SIZE)
 def _flip_token(token: str) -> str:
-    patterns = [
-        (r'([._-])l(?=$|[^a-zA-Z0-9])', r'\1r'),
-        (r'([._-])r(?=$|[^a-zA-Z0-9])', r'\1l'),
-        (r'([._-])L(?=$|[^a-zA-Z0-9])', r'\1R'),
-        (r'([._-])R(?=$|[^a-zA-Z0-9])', r'\1L'),
-        (r'^(l)([._-])', r'r\2'),
-        (r'^(r)([._-])', r'l\2'),
-        (r'^(L)([._-])', r'R\2'),
-        (r'^(R)([._-])', r'L\2'),
-    ]
-    for pattern, replacement in patterns:
-        flipped = re.sub(pattern, replacement, token)
-        if flipped != token:
-            return flipped
+    # Suffix sides win over prefix sides, and l > r > L > R when several are present;
+    # every occurrence of the winning side is swapped.
+    sides = {m.group(2) for m in _SIDE_SUFFIX_RE.finditer(token)}
+    if sides:
+        side = next(s for s in _SIDE_ORDER if s in sides)
+        return _SIDE_SUFFIX_RE.sub(lambda m: m.group(1) + _SIDE_SWAP[side] if m.group(2) == side else m.group(0), token)
+    m = _SIDE_PREFIX_RE.match(token)
+    if m: return _SIDE_SWAP[m.group(1)] + token[1:]
     return token
 
+@functools.lru_cache(maxsize=_FLIP_CACHE_SIZE)
 def flip_path_universal(path: str) -> str:
-    parts = re.split(r'([.\[\]"\'])', path)
-    flipped_parts = [_flip_token(p) for p in parts]
-    return "".join(flipped_parts)
+    return "".join([_flip_token(p) for p in _PATH_SPLIT_RE.split(path)])
+
+@functools.lru_cache(maxsize=_FLIP_CACHE_SIZE)
+def flip_data_path(path: str) -> str:
+    # Quoted names (pose.bones["hand.L"]) are flipped as whole names, the rest token by token.
+    parts = _QUOTED_NAME_RE.split(path)
+    return "".join([f'["{_flip_token(p[2:-2])}"]' if i % 2 else flip_path_universal(p) for i, p in enumerate(parts)])
+
+def strip_side(name: str) -> str:
+    stripped = _SIDE_SUFFIX_RE.sub("", name, count=1)
+    if stripped != name: return stripped
+    return _SIDE_PREFIX_RE.sub("", name, count=1)
+
+def flip_batch(items, paths=False):
+    flip = flip_data_path if paths else _flip_token
+    return [flip(item) for item in items]
+
+def clear_flip_cache():
+    _flip_token.cache_clear(); flip_path_universal.cache_clear(); flip_data_path.cache_clear()
 
 def get_driver_fcurve(context):
-    obj = context.active_object
-    button_pointer = context.button_pointer
-    button_prop = context.button_prop
-    if not obj or not button_pointer or not button_prop: return None, "No active object or button context"
-    try: path = button_pointer.path_from_id(button_prop.identifier)
-    except Exception: return None, "Could not resolve path"
-    if not obj.animation_data: return None, "Object has no animation data"
-    for fc in obj.animation_data.drivers:
-        if fc.data_path == path:
-            if not fc.driver: return None, "FCurve has no driver assigned"
-            return fc.driver, ""
-    return None, "Driver not found"
+    fc, error = get_driver_fcurve_from_context(context)
+    if not fc: return None, error
+    if not fc.driver: return None, "FCurve has no driver assigned"
+    return fc.driver, ""
+
+_ID_TYPE_COLLECTIONS = {
+    'OBJECT': "objects", 'ARMATURE': "armatures", 'MESH': "meshes", 'KEY': "shape_keys", 'MATERIAL': "materials",
+    'CURVE': "curves", 'LATTICE': "lattices", 'CAMERA': "cameras", 'LIGHT': "lights", 'SCENE': "scenes",
+    'WORLD': "worlds", 'TEXTURE': "textures", 'NODETREE': "node_groups", 'ACTION': "actions",
+}
+_SIDE_PREFIX_IN_PATH_RE = re.compile(r'(?:^|[^a-zA-Z0-9])([lLrR])[._-]')
+
+def path_side(path: str):
+    m = _SIDE_SUFFIX_RE.search(path)
+    side = m.group(2) if m else None
+    if side is None:
+        m = _SIDE_PREFIX_IN_PATH_RE.search(path)
+        side = m.group(1) if m else None
+    if side is None: return None
+    return 'LEFT' if side in 'lL' else 'RIGHT'
+
+class DriverFlipIndex:
+    # Name -> ID lookups per ID type and bone-name sets per armature, built once and reused for every target.
+    def __init__(self):
+        self.ids = {}; self.bones = {}
+    def find_id(self, id_type, name):
+        index = self.ids.get(id_type)
+        if index is None:
+            coll = getattr(bpy.data, _ID_TYPE_COLLECTIONS.get(id_type, ""), None)
+            index = self.ids[id_type] = {i.name: i for i in coll} if coll is not None else {}
+        return index.get(name)
+    def bone_names(self, id_data):
+        if id_data is None or getattr(id_data, "type", None) != 'ARMATURE': return None
+        key = id_data.data.as_pointer()
+        names = self.bones.get(key)
+        if names is None: names = self.bones[key] = {b.name for b in id_data.data.bones}
+        return names
+
+def flip_driver_targets(driver, index=None):
+    flipped = unchanged = unresolved = 0
+    for var in driver.variables:
+        for target in var.targets:
+            changed = missing = False
+            if target.id:
+                old_name = target.id.name
+                new_name = _flip_token(old_name)
+                if new_name != old_name:
+                    alt = index.find_id(target.id_type, new_name) if index else bpy.data.objects.get(new_name)
+                    if alt: target.id = alt; changed = True
+                    else: missing = True
+            if target.bone_target:
+                new_bone = _flip_token(target.bone_target)
+                if new_bone != target.bone_target:
+                    bones = index.bone_names(target.id) if index else None
+                    if bones is None or new_bone in bones: target.bone_target = new_bone; changed = True
+                    else: missing = True
+            if var.type == 'SINGLE_PROP' and target.data_path:
+                new_path = flip_data_path(target.data_path)
+                if new_path != target.data_path: target.data_path = new_path; changed = True
+            if missing: unresolved += 1
+            elif changed: flipped += 1
+            else: unchanged += 1
+    return flipped, unchanged, unresolved
 
 class INFAME_OT_flip_driver(bpy.types.Operator):
     bl_idname = "infame.flip_driver"; bl_label = "Flip Driver"; bl_description = "Flip L/R in driver variable targets"; bl_options = {'REGISTER', 'UNDO'}
     def execute(self, context):
         driver, error = get_driver_fcurve(context)
         if not driver: self.report({'WARNING'}, error); return {'CANCELLED'}
-        flipped_any = False
-        for var in driver.variables:
-            for target in var.targets:
-                if target.bone_target:
-                    new_bone = _flip_token(target.bone_target)
-                    if new_bone != target.bone_target: target.bone_target = new_bone; flipped_any = True
-                if var.type == 'SINGLE_PROP' and target.data_path:
-                    new_path = flip_path_universal(target.data_path)
-                    if new_path != target.data_path: target.data_path = new_path; flipped_any = True
-                if target.id:
-                    old_name = target.id.name
-                    new_name = _flip_token(old_name)
-                    if new_name != old_name:
-                        alt = bpy.data.objects.get(new_name)
-                        if alt: target.id = alt; flipped_any = True
-        if flipped_any: self.report({'INFO'}, "Driver variables flipped"); context.view_layer.update()
+        flipped, _unchanged, _unresolved = flip_driver_targets(driver)
+        if flipped: self.report({'INFO'}, "Driver variables flipped"); context.view_layer.update()
         else: self.report({'INFO'}, "No flippable L/R variables found")
         return {'FINISHED'}
 
+def iter_object_drivers(objects):
+    for obj in objects:
+        data = obj.data
+        for id_data in (obj, data, getattr(data, "shape_keys", None)):
+            anim = getattr(id_data, "animation_data", None)
+            if anim:
+                for fc in anim.drivers: yield id_data, fc
+
+def flip_drivers(armatures, side='ALL'):
+    """Flip L/R in the targets of every driver on the armatures. Returns (drivers, flipped, unchanged, unresolved)."""
+    index = DriverFlipIndex()
+    for obj in armatures: index.bone_names(obj)
+    drivers = flipped = unchanged = unresolved = 0
+    for _id_data, fc in iter_object_drivers(armatures):
+        if not fc.driver or (side != 'ALL' and path_side(fc.data_path) != side): continue
+        f, u, x = flip_driver_targets(fc.driver, index)
+        drivers += 1; flipped += f; unchanged += u; unresolved += x
+    return drivers, flipped, unchanged, unresolved
+
+class INFAME_OT_flip_all_drivers(bpy.types.Operator):
+    bl_idname = "infame.flip_all_drivers"; bl_label = "Flip All Drivers"; bl_description = "Flip L/R in the targets of every driver on the selected armatures"; bl_options = {'REGISTER', 'UNDO'}
+    side: bpy.props.EnumProperty(items=[('ALL', "All", "Flip every driver"), ('LEFT', "Left", "Only drivers on left-side properties"), ('RIGHT', "Right", "Only drivers on right-side properties")], name="Side")
+    def execute(self, context):
+        armatures = [o for o in context.selected_objects if o.type == 'ARMATURE']
+        if not armatures: self.report({'WARNING'}, "Select at least one armature"); return {'CANCELLED'}
+        drivers, flipped, unchanged, unresolved = flip_drivers(armatures, self.side)
+        if flipped: context.view_layer.update()
+        self.report({'WARNING'} if unresolved else {'INFO'}, f"{drivers} drivers: {flipped} targets flipped, {unchanged} unchanged, {unresolved} unresolved")
+        return {'FINISHED'}
+
+class INFAME_OT_mirror_drivers(bpy.types.Operator):
+    bl_idname = "infame.mirror_drivers"; bl_label = "Mirror Drivers"; bl_description = "Copy every driver on one side of the selected armatures to the mirrored property and flip its targets"; bl_options = {'REGISTER', 'UNDO'}
+    direction: bpy.props.EnumProperty(items=[('LEFT', "L > R", "Mirror left-side drivers to the right"), ('RIGHT', "R > L", "Mirror right-side drivers to the left")], name="Direction")
+    overwrite: bpy.props.BoolProperty(name="Overwrite", description="Replace drivers that already exist on the mirrored property", default=False)
+    def execute(self, context):
+        armatures = [o for o in context.selected_objects if o.type == 'ARMATURE']
+        if not armatures: self.report({'WARNING'}, "Select at least one armature"); return {'CANCELLED'}
+        index = DriverFlipIndex()
+        for obj in armatures: index.bone_names(obj)
+        # Collect sources before adding anything, the driver collections grow while mirroring.
+        sources = []
+        for id_data, fc in iter_object_drivers(armatures):
+            if not fc.driver or path_side(fc.data_path) != self.direction: continue
+            new_path = flip_data_path(fc.data_path)
+            if new_path != fc.data_path: sources.append((id_data, fc, new_path))
+        existing = {}
+        mirrored = skipped = missing = unresolved = 0
+        for id_data, fc, new_path in sources:
+            key = id_data.as_pointer()
+            if key not in existing: existing[key] = {(d.data_path, d.array_index): d for d in id_data.animation_data.drivers}
+            try: id_data.path_resolve(new_path)
+            except ValueError: missing += 1; continue
+            old = existing[key].get((new_path, fc.array_index))
+            if old:
+                if not self.overwrite: skipped += 1; continue
+                id_data.animation_data.drivers.remove(old); invalidate_driver_index(id_data)
+            # from_existing copies expression, variables, modifiers and keyframes in one C-level call.
+            new_fc = id_data.animation_data.drivers.from_existing(src_driver=fc)
+            new_fc.data_path = new_path; new_fc.array_index = fc.array_index; invalidate_driver_index(id_data)
+            existing[key][(new_path, fc.array_index)] = new_fc
+            unresolved += flip_driver_targets(new_fc.driver, index)[2]
+            mirrored += 1
+        if mirrored: context.view_layer.update()
+        self.report({'WARNING'} if missing or unresolved else {'INFO'}, f"{mirrored} drivers mirrored, {skipped} already existed, {missing} missing properties, {unresolved} unresolved targets")
+        return {'FINISHED'}
+
+#----- Driver Health ------------------
+
+_DRIVER_KIND_ITEMS = [
+    ('SIMPLE', "Simple Expression", "Scripted expression handled by Blender's fast built-in evaluator"),
+    ('PYTHON', "Python Expression", "Scripted expression evaluated through the Python interpreter"),
+    ('AVERAGE', "Averaged", ""), ('SUM', "Sum", ""), ('MIN', "Min", ""), ('MAX', "Max", ""),
+]
+
+class InfameDriverReportItem(bpy.types.PropertyGroup):
+    label: bpy.props.StringProperty(name="Driver")
+    owner: bpy.props.StringProperty(name="Owner")
+    data_path: bpy.props.StringProperty(name="Data Path")
+    array_index: bpy.props.IntProperty(name="Index")
+    kind: bpy.props.EnumProperty(items=_DRIVER_KIND_ITEMS, name="Kind")
+    expression: bpy.props.StringProperty(name="Expression")
+    issues: bpy.props.StringProperty(name="Issues")
+    cost_ms: bpy.props.FloatProperty(name="Cost (ms/frame)", default=-1.0)
+
+def classify_driver(owner, fc, bone_names=None):
+    driver = fc.driver
+    kind = ('SIMPLE' if driver.is_simple_expression else 'PYTHON') if driver.type == 'SCRIPTED' else driver.type
+    issues = []
+    if not driver.is_valid: issues.append("invalid driver")
+    if driver.type == 'SCRIPTED' and driver.use_self: issues.append("uses self")
+    if kind == 'PYTHON': issues.append("python expression")
+    bone_names = {} if bone_names is None else bone_names
+    for var in driver.variables:
+        if not var.is_name_valid: issues.append(f"{var.name}: invalid name")
+        for target in var.targets:
+            if var.type == 'CONTEXT_PROP': continue
+            if target.id is None: issues.append(f"{var.name}: no target"); continue
+            if var.type == 'SINGLE_PROP':
+                try: target.id.path_resolve(target.data_path)
+                except ValueError: issues.append(f"{var.name}: bad path")
+                if target.id == owner and target.data_path == fc.data_path: issues.append(f"{var.name}: depends on itself")
+            if target.bone_target and getattr(target.id, "type", None) == 'ARMATURE':
+                key = target.id.as_pointer()
+                if key not in bone_names: bone_names[key] = {b.name for b in target.id.data.bones}
+                if target.bone_target not in bone_names[key]: issues.append(f"{var.name}: missing bone")
+    return kind, issues
+
+def scan_drivers():
+    bone_names = {}; records = []
+    for owner, fc in iter_file_drivers():
+        if not fc.driver: continue
+        kind, issues = classify_driver(owner, fc, bone_names)
+        records.append((owner, fc, kind, issues))
+    return records
+
+def _time_frames(scene, first_frame, frames):
+    start = time.perf_counter()
+    for frame in range(first_frame, first_frame + frames): scene.frame_set(frame)
+    return time.perf_counter() - start
+
+def profile_drivers(scene, fcurves, frames=10):
+    # Intended for background runs: baseline with every driver muted, then each driver alone. Costs are ms per frame.
+    all_fcurves = [fc for _owner, fc in iter_file_drivers()]
+    muted = [fc.mute for fc in all_fcurves]; frame = scene.frame_current
+    costs = []
+    try:
+        for fc in all_fcurves: fc.mute = True
+        baseline = _time_frames(scene, frame, frames)
+        for fc in fcurves:
+            fc.mute = False
+            costs.append(max(0.0, (_time_frames(scene, frame, frames) - baseline) * 1000.0 / frames))
+            fc.mute = True
+    finally:
+        for fc, state in zip(all_fcurves, muted): fc.mute = state
+        scene.frame_set(frame)
+    return costs
+
+class INFAME_OT_scan_drivers(bpy.types.Operator):
+    bl_idname = "infame.scan_drivers"; bl_label = "Scan Drivers"; bl_description = "Classify every driver in the file and flag invalid, self-dependent and Python-evaluated drivers"
+    profile: bpy.props.BoolProperty(name="Profile", description="Also time each driver by stepping frames (slow, best run in background mode)", default=False)
+    frames: bpy.props.IntProperty(name="Frames", description="Frames stepped per measurement", default=10, min=1)
+    limit: bpy.props.IntProperty(name="Limit", description="Maximum number of drivers to time, Python and flagged drivers first", default=200, min=1)
+    def execute(self, context):
+        records = scan_drivers()
+        report = context.window_manager.infame_driver_report; report.clear()
+        for owner, fc, kind, issues in records:
+            item = report.add()
+            item.owner = owner.name; item.data_path = fc.data_path; item.array_index = fc.array_index
+            item.label = f"{owner.name}: {fc.data_path}[{fc.array_index}]"
+            item.kind = kind; item.expression = fc.driver.expression if fc.driver.type == 'SCRIPTED' else ""; item.issues = ", ".join(issues)
+        if self.profile and records:
+            ranked = sorted(range(len(records)), key=lambda i: (records[i][2] != 'PYTHON', not records[i][3]))[:self.limit]
+            costs = profile_drivers(context.scene, [records[i][1] for i in ranked], self.frames)
+            for i, cost in zip(ranked, costs): report[i].cost_ms = cost
+        python = sum(1 for r in records if r[2] == 'PYTHON'); flagged = sum(1 for r in records if r[3])
+        self.report({'INFO'}, f"{len(records)} drivers, {python} Python expressions, {flagged} with issues")
+        return {'FINISHED'}
+
+class INFAME_OT_export_driver_report(bpy.types.Operator):
+    bl_idname = "infame.export_driver_report"; bl_label = "Export Driver Report"; bl_description = "Write the driver scan results to a CSV file"
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.csv", options={'HIDDEN'})
+    def execute(self, context):
+        report = context.window_manager.infame_driver_report
+        with open(bpy.path.ensure_ext(self.filepath, ".csv"), 'w', newline="") as f:
+            writer = csv.writer(f); writer.writerow(["owner", "data_path", "array_index", "kind", "cost_ms", "issues", "expression"])
+            for item in report: writer.writerow([item.owner, item.data_path, item.array_index, item.kind, f"{item.cost_ms:.4f}" if item.cost_ms >= 0 else "", item.issues, item.expression])
+        self.report({'INFO'}, f"Saved: {self.filepath}")
+        return {'FINISHED'}
+    def invoke(self, context, event):
+        if not self.filepath: self.filepath = "driver_report.csv"
+        context.window_manager.fileselect_add(self); return {'RUNNING_MODAL'}
+
+class INFAME_UL_driver_report(bpy.types.UIList):
+    sort_mode: bpy.props.EnumProperty(items=[('COST', "Cost", "Slowest first"), ('ISSUES', "Issues", "Flagged first"), ('NAME', "Name", "Alphabetical")], name="Sort", default='COST')
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.label(text=item.label, icon='ERROR' if item.issues else 'DRIVER')
+        row.label(text=item.kind.title())
+        row.label(text=f"{item.cost_ms:.3f} ms" if item.cost_ms >= 0 else "-")
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True); row.prop(self, "filter_name", text=""); row.prop(self, "sort_mode", expand=True)
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        if self.filter_name: flags = bpy.types.UI_UL_list.filter_items_by_name(self.filter_name, self.bitflag_filter_item, items, "label")
+        else: flags = [self.bitflag_filter_item] * len(items)
+        if self.sort_mode == 'COST': key = lambda i: -items[i].cost_ms
+        elif self.sort_mode == 'ISSUES': key = lambda i: (not items[i].issues, items[i].kind != 'PYTHON')
+        else: key = lambda i: items[i].label.lower()
+        order = [0] * len(items)
+        for rank, i in enumerate(sorted(range(len(items)), key=key)): order[i] = rank
+        return flags, order
+
+class INFAME_PT_driver_report(bpy.types.Panel):
+    bl_label = "Driver Health"; bl_idname = "INFAME_PT_driver_report"; bl_parent_id = "INFAME_PT_rig_tools"; bl_options = {'DEFAULT_CLOSED'}
+    bl_space_type = 'VIEW_3D'; bl_region_type = 'UI'; bl_category = "Infame Rig Tools"
+    def draw(self, context):
+        layout = self.layout; wm = context.window_manager
+        row = layout.row(align=True)
+        row.operator("infame.scan_drivers", icon='VIEWZOOM')
+        row.operator("infame.scan_drivers", text="Scan + Profile", icon='TIME').profile = True
+        layout.template_list("INFAME_UL_driver_report", "", wm, "infame_driver_report", wm, "infame_driver_report_index", rows=8)
+        report = wm.infame_driver_report
+        if 0 <= wm.infame_driver_report_index < len(report):
+            item = report[wm.infame_driver_report_index]; col = layout.column(align=True)
+            if item.expression: col.label(text=f"Expression: {item.expression}")
+            if item.issues: col.label(text=f"Issues: {item.issues}", icon='ERROR')
+        layout.operator("infame.export_driver_report", icon='EXPORT')
+
 # ---- Live Parenting Operator ----
 
+CONNECT_TOLERANCE = 0.001
+
+def parent_edit_bone(cbone, pbone, tolerance=CONNECT_TOLERANCE):
+    cbone.parent = pbone; cbone.use_connect = False
+    if (pbone.tail - cbone.head).length < tolerance: cbone.use_connect = True
+
 class INFAME_OT_live_parenting(bpy.types.Operator):
     bl_idname = "infame.live_parenting"; bl_label = "Live Parenting"; bl_description = "Parent selected items progressively. Add to Quick Favorites via: Object > Parent > (right click)"; bl_options = {'REGISTER', 'UNDO'}
-    _handle = None; last_item = None; rollback_data = []
+    deferred: bpy.props.BoolProperty(name="Deferred Commit", description="Record the chain with a preview and apply all parenting at once on Enter", default=False)
+    _handle = None; _preview_handle = None; last_item = None; check_pending = False
+    # Selection only changes on clicks; other events (mouse moves, timers) are skipped unless a click is still settling.
+    _SELECT_EVENTS = {'LEFTMOUSE', 'RIGHTMOUSE'}
     def invoke(self, context, event):
-        self.last_item = None; self.rollback_data.clear()
+        # Per-invocation state: rollback entries are (child, old parent, matrix or use_connect), the chain maps child name -> parent name.
+        self.last_item = None; self.check_pending = False; self.rollback_data = []; self.chain = {}; self.preview_batch = None
         if context.mode == 'OBJECT':
-            for obj in context.scene.objects: obj.select_set(False)
+            for obj in context.selected_objects: obj.select_set(False)
             context.view_layer.objects.active = None
         elif context.mode == 'EDIT_ARMATURE':
-            for bone in context.object.data.edit_bones: bone.select = False
+            for bone in context.selected_bones or (): bone.select = False
         if not self._handle: self._handle = bpy.types.SpaceView3D.draw_handler_add(self.draw_callback, (context,), 'WINDOW', 'POST_PIXEL')
-        context.window_manager.modal_handler_add(self)
+        if self.deferred and not self._preview_handle:
+            self.shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+            self._preview_handle = bpy.types.SpaceView3D.draw_handler_add(self.draw_preview_callback, (context,), 'WINDOW', 'POST_VIEW')
+        context.window_manager.modal_handler_add(self); self.redraw(context)
         self.report({'INFO'}, "Live Parenting: Select in order. Enter to finish, Esc to cancel.")
         return {'RUNNING_MODAL'}
     def modal(self, context, event):
-        if context.area: context.area.tag_redraw()
-        if event.type == 'ESC': self.rollback(context); self.cleanup_draw(); self.report({'WARNING'}, "Live Parenting cancelled."); return {'CANCELLED'}
-        elif event.type == 'RET' and event.value == 'PRESS': self.cleanup_draw(); self.report({'INFO'}, "Live Parenting finished."); return {'FINISHED'}
+        if event.type == 'ESC': self.rollback(context); self.cleanup_draw(); self.redraw(context); self.report({'WARNING'}, "Live Parenting cancelled."); return {'CANCELLED'}
+        elif event.type == 'RET' and event.value == 'PRESS':
+            if self.deferred: self.commit_chain(context)
+            self.cleanup_draw(); self.redraw(context); self.report({'INFO'}, "Live Parenting finished."); return {'FINISHED'}
+        is_select = event.type in self._SELECT_EVENTS
+        if not (is_select or self.check_pending): return {'PASS_THROUGH'}
+        self.check_pending = is_select
         current = self.get_current_selection(context)
         if current and current != self.last_item:
-            if self.last_item: self.do_parent(context, current, self.last_item)
-            self.last_item = current; self.force_selection(context, current)
+            previous = self.last_item
+            if previous: self.do_parent(context, current, previous)
+            self.last_item = current; self.force_selection(context, current, previous); self.redraw(context)
         return {'PASS_THROUGH'}
+    def redraw(self, context):
+        screen = context.screen
+        for area in (screen.areas if screen else ()):
+            if area.type == 'VIEW_3D': area.tag_redraw()
     def get_current_selection(self, context):
         if context.mode == 'OBJECT': return context.active_object
         elif context.mode == 'EDIT_ARMATURE': return context.active_bone
         return None
-    def force_selection(self, context, item):
+    def force_selection(self, context, item, previous=None):
+        # Only the previous pick and whatever the click added can be selected, so clear just those.
         if context.mode == 'OBJECT':
-            for obj in context.selected_objects: obj.select_set(False)
+            for obj in context.selected_objects:
+                if obj != item: obj.select_set(False)
             item.select_set(True); context.view_layer.objects.active = item
         elif context.mode == 'EDIT_ARMATURE':
-            for bone in context.object.data.edit_bones: bone.select = False
+            if previous: previous.select = False
+            for bone in context.selected_bones or ():
+                if bone != item: bone.select = False
             item.select = True
     def do_parent(self, context, parent, child):
         if parent == child: return
+        if self.deferred: self.chain[child.name] = parent.name; self.build_preview(context); return
         if context.mode == 'OBJECT':
             self.rollback_data.append((child, child.parent, child.matrix_world.copy())); child.parent = parent; child.matrix_parent_inverse = parent.matrix_world.inverted()
         elif context.mode == 'EDIT_ARMATURE':
             ebones = context.object.data.edit_bones
             if parent.name not in ebones or child.name not in ebones: return
             pbone = ebones[parent.name]; cbone = ebones[child.name]
-            self.rollback_data.append((cbone, cbone.parent, cbone.use_connect)); cbone.parent = pbone; cbone.use_connect = False
-            if (pbone.tail - cbone.head).length < 0.001: cbone.use_connect = True
+            self.rollback_data.append((cbone, cbone.parent, cbone.use_connect)); parent_edit_bone(cbone, pbone)
+    def commit_chain(self, context):
+        if context.mode == 'OBJECT':
+            objects = bpy.data.objects
+            pairs = [(objects.get(c), objects.get(p)) for c, p in self.chain.items()]
+            # Parenting with the parent's inverse keeps every world matrix as is, so all inverses can be read up front.
+            inverses = {parent.name: parent.matrix_world.inverted() for child, parent in pairs if child and parent}
+            for child, parent in pairs:
+                if child and parent: child.parent = parent; child.matrix_parent_inverse = inverses[parent.name]
+        elif context.mode == 'EDIT_ARMATURE':
+            ebones = context.object.data.edit_bones
+            for c, p in self.chain.items():
+                cbone = ebones.get(c); pbone = ebones.get(p)
+                if cbone and pbone: parent_edit_bone(cbone, pbone)
+        context.view_layer.update()
+    def build_preview(self, context):
+        coords = []
+        if context.mode == 'OBJECT':
+            objects = bpy.data.objects
+            for c, p in self.chain.items():
+                child = objects.get(c); parent = objects.get(p)
+                if child and parent: coords += [child.matrix_world.translation[:], parent.matrix_world.translation[:]]
+        elif context.mode == 'EDIT_ARMATURE':
+            ebones = context.object.data.edit_bones; mw = context.object.matrix_world
+            for c, p in self.chain.items():
+                cbone = ebones.get(c); pbone = ebones.get(p)
+                if cbone and pbone: coords += [(mw @ cbone.head)[:], (mw @ pbone.tail)[:]]
+        self.preview_batch = batch_for_shader(self.shader, 'LINES', {"pos": coords}) if coords else None
     def rollback(self, context):
         if context.mode == 'OBJECT':
             for obj, old_parent, old_matrix in reversed(self.rollback_data): obj.parent = old_parent; obj.matrix_world = old_matrix
         elif context.mode == 'EDIT_ARMATURE':
             for bone, old_parent, old_connect in reversed(self.rollback_data): bone.parent = old_parent; bone.use_connect = old_connect
+        self.rollback_data = []; self.chain = {}
     def cleanup_draw(self):
         if self._handle: bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW'); self._handle = None
+        if self._preview_handle: bpy.types.SpaceView3D.draw_handler_remove(self._preview_handle, 'WINDOW'); self._preview_handle = None
     def draw_callback(self, context):
         font_id = 0; blf.position(font_id, 20, 50, 0); blf.size(font_id, 18, 72); blf.color(font_id, 1.0, 1.0, 0.0, 1.0)
-        blf.draw(font_id, "LIVE PARENTING ACTIVE - Enter to confirm, Esc to cancel")
+        if self.deferred: blf.draw(font_id, f"LIVE PARENTING (DEFERRED, {len(self.chain)} links) - Enter to apply, Esc to cancel")
+        else: blf.draw(font_id, "LIVE PARENTING ACTIVE - Enter to confirm, Esc to cancel")
+    def draw_preview_callback(self, context):
+        if not self.preview_batch: return
+        gpu.state.line_width_set(2.0); self.shader.bind(); self.shader.uniform_float("color", (1.0, 1.0, 0.0, 1.0))
+        self.preview_batch.draw(self.shader); gpu.state.line_width_set(1.0)
+
+def _creates_cycle(child, parent, parents, compress=False):
+    # parents maps name -> parent name including assignments made so far. When every child is still a root
+    # (only unparented items are parented) the links can be path-compressed, keeping long chains near O(1).
+    node = parent
+    while parents.get(node) is not None:
+        if node == child: return True
+        node = parents[node]
+    if compress:
+        walk = parent
+        while walk != node: parents[walk], walk = node, parents[walk]
+    return node == child
+
+class INFAME_OT_auto_parent(bpy.types.Operator):
+    bl_idname = "infame.auto_parent"; bl_label = "Auto-Parent Selected"; bl_description = "Parent each selected bone to the bone whose tail touches its head (objects: nearest selected origin)"; bl_options = {'REGISTER', 'UNDO'}
+    tolerance: bpy.props.FloatProperty(name="Tolerance", description="Maximum distance between the child's head and the parent's tail", default=0.001, min=0.0, subtype='DISTANCE')
+    only_unparented: bpy.props.BoolProperty(name="Only Unparented", description="Leave items that already have a parent untouched", default=True)
+    @classmethod
+    def poll(cls, context): return context.mode in {'OBJECT', 'EDIT_ARMATURE'}
+    def execute(self, context):
+        if context.mode == 'EDIT_ARMATURE':
+            candidates = list(context.object.data.edit_bones); children = context.selected_editable_bones or []
+            tails = [b.tail for b in candidates]; heads = lambda item: item.head
+            parents = {b.name: b.parent.name if b.parent else None for b in candidates}
+        else:
+            candidates = list(context.selected_editable_objects); children = candidates
+            tails = [o.matrix_world.translation for o in candidates]; heads = lambda item: item.matrix_world.translation
+            # Unselected ancestors can still close a loop, so record each candidate's whole parent chain.
+            parents = {}
+            for obj in candidates:
+                while obj is not None and obj.name not in parents:
+                    parents[obj.name] = obj.parent.name if obj.parent else None; obj = obj.parent
+        if not children: self.report({'WARNING'}, "Nothing selected"); return {'CANCELLED'}
+        tree = kdtree.KDTree(len(tails))
+        for i, co in enumerate(tails): tree.insert(co, i)
+        tree.balance()
+        pairs = []
+        for child in children:
+            if self.only_unparented and child.parent: continue
+            for _co, i, _dist in sorted(tree.find_range(heads(child), self.tolerance), key=lambda hit: hit[2]):
+                parent = candidates[i]
+                if parent == child or _creates_cycle(child.name, parent.name, parents, self.only_unparented): continue
+                parents[child.name] = parent.name; pairs.append((child, parent)); break
+        if context.mode == 'EDIT_ARMATURE':
+            for child, parent in pairs: parent_edit_bone(child, parent)
+            connected = sum(1 for child, _parent in pairs if child.use_connect)
+            self.report({'INFO'}, f"{len(pairs)} bones parented, {connected} connected")
+        else:
+            inverses = {parent.name: parent.matrix_world.inverted() for _child, parent in pairs}
+            for child, parent in pairs: child.parent = parent; child.matrix_parent_inverse = inverses[parent.name]
+            context.view_layer.update()
+            self.report({'INFO'}, f"{len(pairs)} objects parented")
+        return {'FINISHED'}
+
+_SIDE_CONVENTIONS = {'DOT': (".L", ".R", False), 'UNDERSCORE': ("_L", "_R", False), 'PREFIX': ("L_", "R_", True)}
+
+def pair_mirrored_bones(heads, tails, tolerance):
+    # +X is the character's left. Each left bone looks up its X-mirrored head in a KD-tree and
+    # keeps the closest unpaired candidate whose tail also mirrors within the tolerance.
+    tree = kdtree.KDTree(len(heads))
+    for i, co in enumerate(heads): tree.insert(co, i)
+    tree.balance()
+    pairs = []; used = set()
+    for i, (head, tail) in enumerate(zip(heads, tails)):
+        if i in used: continue
+        if not (head.x > tolerance or (abs(head.x) <= tolerance and tail.x > tolerance)): continue
+        mirror_head = Vector((-head.x, head.y, head.z)); mirror_tail = Vector((-tail.x, tail.y, tail.z))
+        best = None
+        for _co, j, dist in tree.find_range(mirror_head, tolerance):
+            if j == i or j in used: continue
+            tail_dist = (tails[j] - mirror_tail).length
+            if tail_dist <= tolerance and (best is None or dist + tail_dist < best[0]): best = (dist + tail_dist, j)
+        if best: used.add(i); used.add(best[1]); pairs.append((i, best[1]))
+    return pairs, used
+
+class INFAME_OT_symmetrize_bone_names(bpy.types.Operator):
+    bl_idname = "infame.symmetrize_bone_names"; bl_label = "Symmetrize L/R Names"; bl_description = "Pair every bone with its X-mirrored counterpart and rename both sides with one convention"; bl_options = {'REGISTER', 'UNDO'}
+    convention: bpy.props.EnumProperty(items=[('DOT', ".L / .R", "Suffix with a dot"), ('UNDERSCORE', "_L / _R", "Suffix with an underscore"), ('PREFIX', "L_ / R_", "Prefix")], name="Convention")
+    tolerance: bpy.props.FloatProperty(name="Tolerance", description="Maximum distance between a bone and the mirror of its pair", default=0.001, min=0.0, subtype='DISTANCE')
+    def execute(self, context):
+        obj = context.object
+        if not obj or obj.type != 'ARMATURE': self.report({'WARNING'}, "Active object is not an armature"); return {'CANCELLED'}
+        if context.mode == 'EDIT_ARMATURE':
+            bones = list(obj.data.edit_bones); heads = [b.head.copy() for b in bones]; tails = [b.tail.copy() for b in bones]
+        else:
+            bones = list(obj.data.bones); heads = [b.head_local.copy() for b in bones]; tails = [b.tail_local.copy() for b in bones]
+        pairs, used = pair_mirrored_bones(heads, tails, self.tolerance)
+        left_tag, right_tag, is_prefix = _SIDE_CONVENTIONS[self.convention]
+        changes = {}; linked = {}
+        for i, j in pairs:
+            linked[bones[i].name] = bones[j].name; linked[bones[j].name] = bones[i].name
+            base = strip_side(bones[i].name)
+            new_left = left_tag + base if is_prefix else base + left_tag
+            new_right = _flip_token(new_left)
+            if strip_side(new_right) != base or new_right == new_left: new_right = right_tag + base if is_prefix else base + right_tag
+            for bone, new in ((bones[i], new_left), (bones[j], new_right)):
+                if bone.name != new: changes[bone.name] = new
+        skipped = apply_renames({b.name: b for b in bones}, changes, linked)
+        unpaired = sum(1 for i, (h, t) in enumerate(zip(heads, tails)) if i not in used and (abs(h.x) > self.tolerance or abs(t.x) > self.tolerance))
+        self.report({'WARNING'} if unpaired or skipped else {'INFO'}, f"{len(pairs)} pairs, {len(changes)} bones renamed, {unpaired} unpaired, {skipped} name conflicts")
+        return {'FINISHED'}
 
 # ---- Context Menus ----
 
@@ -344,10 +1330,26 @@ def draw_driver_context_menu(self, context):
     layout.separator()
     op = layout.operator("infame.convert_driver_curve", text="Convert to Linear"); op.mode = 'LINEAR'
     op = layout.operator("infame.convert_driver_curve", text="Convert to Constant"); op.mode = 'CONSTANT'
+    op = layout.operator("infame.convert_driver_curve", text="Convert to Bezier"); op.mode = 'BEZIER'
+    layout.operator("infame.simplify_driver_curve", text="Simplify Driver Curve").scope = 'BUTTON'
+    layout.operator("infame.optimize_driver_expressions", text="Optimize Driver Expression").scope = 'BUTTON'
+
+def draw_drivers_editor_menu(self, context):
+    if getattr(context.space_data, "mode", None) != 'DRIVERS': return
+    layout = self.layout; layout.separator()
+    op = layout.operator("infame.invert_current_driver", text="Invert Selected Drivers (from Zero)"); op.mode = 'CURVE_ZERO'; op.scope = 'SELECTED'
+    op = layout.operator("infame.invert_current_driver", text="Invert Selected Drivers (Average)"); op.mode = 'CURVE_AVG'; op.scope = 'SELECTED'
+    for mode, label in [('LINEAR', "Linear"), ('CONSTANT', "Constant"), ('BEZIER', "Bezier")]:
+        op = layout.operator("infame.convert_driver_curve", text=f"Convert Selected Drivers to {label}"); op.mode = mode; op.scope = 'SELECTED'
+    layout.operator("infame.simplify_driver_curve", text="Simplify Selected Driver Curves").scope = 'SELECTED'
+    layout.operator("infame.optimize_driver_expressions", text="Optimize Selected Driver Expressions").scope = 'SELECTED'
 
 def draw_live_parenting_in_object_menu(self, context):
     mode = context.mode
-    if mode in {'OBJECT', 'EDIT_ARMATURE'}: self.layout.separator(); self.layout.operator("infame.live_parenting", text="Live Parenting")
+    if mode in {'OBJECT', 'EDIT_ARMATURE'}:
+        self.layout.separator(); self.layout.operator("infame.live_parenting", text="Live Parenting")
+        self.layout.operator("infame.live_parenting", text="Live Parenting (Deferred)").deferred = True
+        self.layout.operator("infame.auto_parent", text="Auto-Parent Selected")
         
 def draw_flip_driver_menu(self, context):
     layout = self.layout; layout.separator(); layout.operator("infame.flip_driver", text="Flip Driver Sides, (L>R,R>L)")
@@ -386,13 +1388,16 @@ class INFAME_PT_rig_tools(bpy.types.Panel):
 
                 col.label(text="Suffix:")
                 row = col.row(align=True)
-                for s in ["_L", "_R"]:
+                for s in ["_L", "_R", ".L", ".R"]:
                     row.operator("infame.set_suffix", text=s).suffix = s
                 col.operator("infame.clear_suffix", text="Clear Suffix", icon='X')
 
                 col.separator()
                 col.prop(props, "bone_name", text="Final Name")
                 col.operator("infame.rename_bone", icon="BONE_DATA", text="Rename Bone")
+                col.separator()
+                col.operator("infame.symmetrize_bone_names", icon="MOD_MIRROR")
+            col.operator("infame.batch_rename", icon="SORTALPHA")
         layout.separator()
 
         # --- Viewport Display Section ---
@@ -413,14 +1418,186 @@ class INFAME_PT_rig_tools(bpy.types.Panel):
                     box.operator("infame.toggle_wire_overlay", icon="MOD_WIREFRAME")
                 else: box.label(text="Select Armature or Mesh")
             else: box.label(text="Select an object")
+            box.separator()
+            row = box.row(align=True)
+            row.prop(props, "performance_scope", text="")
+            if props.performance_scope == 'COLLECTION': row.prop(props, "performance_collection", text="")
+            active = _PERFORMANCE_STATE_KEY in context.scene
+            box.operator("infame.performance_display", text="Restore Display" if active else "Performance Display", icon='LOOP_BACK' if active else 'MOD_TIME', depress=active)
         layout.separator()
         
+        # --- Driver Tools Section ---
+        row = layout.row(align=True)
+        row.prop(props, "show_driver_tools", text="Driver Tools", icon="TRIA_DOWN" if props.show_driver_tools else "TRIA_RIGHT", emboss=False)
+        if props.show_driver_tools:
+            box = layout.box()
+            box.label(text="Flip All Drivers:")
+            row = box.row(align=True)
+            for side, label in [('ALL', 'All'), ('LEFT', 'Left'), ('RIGHT', 'Right')]:
+                op = row.operator("infame.flip_all_drivers", text=label); op.side = side
+            box.label(text="Mirror Drivers:")
+            row = box.row(align=True)
+            for direction, label in [('LEFT', 'L > R'), ('RIGHT', 'R > L')]:
+                op = row.operator("infame.mirror_drivers", text=label); op.direction = direction
+            box.separator()
+            box.prop(props, "driver_scope")
+            box.prop(props, "driver_path_filter")
+            row = box.row(align=True); row.label(text="Invert:")
+            for mode, label in [('CURVE_ZERO', 'Zero'), ('CURVE_AVG', 'Average')]:
+                op = row.operator("infame.invert_current_driver", text=label); op.mode = mode; op.scope = props.driver_scope; op.path_filter = props.driver_path_filter
+            row = box.row(align=True); row.label(text="Convert:")
+            for mode, label in [('LINEAR', 'Linear'), ('CONSTANT', 'Const'), ('BEZIER', 'Bezier')]:
+                op = row.operator("infame.convert_driver_curve", text=label); op.mode = mode; op.scope = props.driver_scope; op.path_filter = props.driver_path_filter
+            row = box.row(align=True); row.label(text="Handles:")
+            for handle_type, label in [('AUTO_CLAMPED', 'Clamped'), ('VECTOR', 'Vector')]:
+                op = row.operator("infame.convert_driver_curve", text=label); op.mode = 'KEEP'; op.handle_type = handle_type; op.scope = props.driver_scope; op.path_filter = props.driver_path_filter
+            row = box.row(align=True); row.label(text="Reduce Keys:")
+            op = row.operator("infame.simplify_driver_curve", text="Simplify"); op.scope = props.driver_scope; op.path_filter = props.driver_path_filter
+            row = box.row(align=True); row.label(text="Expressions:")
+            for dry_run, label in [(True, "Check"), (False, "Optimize")]:
+                op = row.operator("infame.optimize_driver_expressions", text=label); op.dry_run = dry_run; op.scope = props.driver_scope; op.path_filter = props.driver_path_filter
+        layout.separator()
+
         # --- Parenting Section ---
         row = layout.row(align=True)
         row.prop(props, "show_parenting_tools", text="Parenting", icon="TRIA_DOWN" if props.show_parenting_tools else "TRIA_RIGHT", emboss=False)
         if props.show_parenting_tools:
             box = layout.box()
             box.operator("infame.live_parenting", icon='CONSTRAINT')
+            box.operator("infame.live_parenting", text="Live Parenting (Deferred)", icon='CONSTRAINT').deferred = True
+            box.operator("infame.auto_parent", icon='BONE_DATA')
+
+# ---- Instrumentation ----
+# Opt-in timing of every INFAME_OT_* / MESHCODING_OT_* operator and the two sidebar panels. Methods of the
+# registered classes are wrapped in place while enabled and restored when disabled. The number of IDs the
+# depsgraph reports as updated after an operator is attributed to that operator's record.
+
+INSTRUMENT_PREFIXES = ("INFAME_OT_", "MESHCODING_OT_")
+INSTRUMENT_PANELS = ("INFAME_PT_rig_tools", "VIEW3D_PT_mesh_coding")
+INSTRUMENT_BUFFER_SIZE = 4096
+_INSTRUMENT_METHODS = ("execute", "invoke", "modal", "draw")
+# Records are [wall clock, class name, method, ms, ids updated]; pending is the last operator record awaiting its update count.
+_instrument = {"records": collections.deque(maxlen=INSTRUMENT_BUFFER_SIZE), "counts": {}, "wrapped": [], "pending": None,
+               "profile_remaining": 0, "profiler": None, "profiled": 0}
+
+def _instrument_wrap(cls_name, method, func):
+    @functools.wraps(func)
+    def wrapper(self, context, *args):
+        profiler = None
+        if method != 'draw' and _instrument["profile_remaining"] > 0:
+            _instrument["profile_remaining"] -= 1; _instrument["profiled"] += 1
+            profiler = _instrument["profiler"] = _instrument["profiler"] or cProfile.Profile()
+            profiler.enable()
+        result = None; start = time.perf_counter()
+        try:
+            result = func(self, context, *args); return result
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            if profiler: profiler.disable()
+            # Pass-through modal calls are mouse moves and other events the operator ignores.
+            if not (method == 'modal' and result == {'PASS_THROUGH'}):
+                record = [time.time(), cls_name, method, elapsed, 0]
+                _instrument["records"].append(record)
+                count = _instrument["counts"].setdefault((cls_name, method), [0, 0.0]); count[0] += 1; count[1] += elapsed
+                if method != 'draw': _instrument["pending"] = record
+    wrapper._instrument_original = func
+    return wrapper
+
+def _instrumented_classes():
+    for name in dir(bpy.types):
+        if name.startswith(INSTRUMENT_PREFIXES) or name in INSTRUMENT_PANELS: yield name, getattr(bpy.types, name)
+
+@persistent
+def _instrument_depsgraph_handler(scene, depsgraph):
+    record = _instrument["pending"]
+    if record is not None: record[4] += len(depsgraph.updates); _instrument["pending"] = None
+
+def enable_instrumentation():
+    if _instrument["wrapped"]: return
+    for name, cls in _instrumented_classes():
+        for method in _INSTRUMENT_METHODS:
+            func = cls.__dict__.get(method)
+            if func is None or hasattr(func, "_instrument_original"): continue
+            setattr(cls, method, _instrument_wrap(name, method, func)); _instrument["wrapped"].append((cls, method, func))
+    bpy.app.handlers.depsgraph_update_post.append(_instrument_depsgraph_handler)
+
+def disable_instrumentation():
+    for cls, method, func in _instrument["wrapped"]: setattr(cls, method, func)
+    _instrument["wrapped"].clear(); _instrument["pending"] = None
+    if _instrument_depsgraph_handler in bpy.app.handlers.depsgraph_update_post: bpy.app.handlers.depsgraph_update_post.remove(_instrument_depsgraph_handler)
+
+def reset_instrumentation():
+    _instrument["records"].clear(); _instrument["counts"].clear(); _instrument["pending"] = None
+    _instrument["profiler"] = None; _instrument["profiled"] = 0; _instrument["profile_remaining"] = 0
+
+def instrumentation_stats():
+    # Rolling stats over the ring buffer: (name, method) -> (calls, mean ms, max ms, ids updated).
+    stats = {}
+    for _t, name, method, ms, ids in _instrument["records"]:
+        entry = stats.setdefault((name, method), [0, 0.0, 0.0, 0]); entry[0] += 1; entry[1] += ms; entry[2] = max(entry[2], ms); entry[3] += ids
+    return {key: (calls, total / calls, peak, ids) for key, (calls, total, peak, ids) in stats.items()}
+
+def _update_instrumentation(self, context):
+    if self.infame_instrumentation: enable_instrumentation()
+    else: disable_instrumentation()
+
+@persistent
+def _sync_instrumentation_handler(*_args):
+    # Loading a file brings its own window manager, so follow its toggle instead of the old one.
+    wm = bpy.context.window_manager
+    if wm and wm.infame_instrumentation: enable_instrumentation()
+    else: disable_instrumentation()
+
+class INFAME_OT_profile_next(bpy.types.Operator):
+    bl_idname = "infame.profile_next"; bl_label = "Profile Next Calls"; bl_description = "Capture a cProfile profile of the next operator calls"
+    count: bpy.props.IntProperty(name="Calls", default=5, min=1)
+    def execute(self, context):
+        if not _instrument["wrapped"]: self.report({'WARNING'}, "Enable instrumentation first"); return {'CANCELLED'}
+        _instrument["profile_remaining"] = self.count
+        self.report({'INFO'}, f"Profiling the next {self.count} operator calls"); return {'FINISHED'}
+
+class INFAME_OT_reset_instrumentation(bpy.types.Operator):
+    bl_idname = "infame.reset_instrumentation"; bl_label = "Reset Stats"; bl_description = "Clear recorded timings and profiles"
+    def execute(self, context):
+        reset_instrumentation(); return {'FINISHED'}
+
+class INFAME_OT_dump_instrumentation(bpy.types.Operator):
+    bl_idname = "infame.dump_instrumentation"; bl_label = "Dump Timings"; bl_description = "Write recorded timings to JSON, and the captured profile next to it as .prof"
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+    def execute(self, context):
+        path = bpy.path.ensure_ext(self.filepath, ".json")
+        data = {
+            "records": [{"time": t, "name": name, "method": method, "ms": ms, "ids_updated": ids} for t, name, method, ms, ids in _instrument["records"]],
+            "totals": [{"name": name, "method": method, "calls": calls, "total_ms": total} for (name, method), (calls, total) in sorted(_instrument["counts"].items())],
+        }
+        with open(path, 'w') as f: json.dump(data, f, indent=1)
+        if _instrument["profiler"]:
+            pstats.Stats(_instrument["profiler"]).dump_stats(path[:-5] + ".prof")
+        self.report({'INFO'}, f"Saved: {path}"); return {'FINISHED'}
+    def invoke(self, context, event):
+        if not self.filepath: self.filepath = "infame_timings.json"
+        context.window_manager.fileselect_add(self); return {'RUNNING_MODAL'}
+
+class INFAME_PT_instrumentation(bpy.types.Panel):
+    bl_label = "Instrumentation"; bl_idname = "INFAME_PT_instrumentation"; bl_parent_id = "INFAME_PT_rig_tools"; bl_options = {'DEFAULT_CLOSED'}
+    bl_space_type = 'VIEW_3D'; bl_region_type = 'UI'; bl_category = "Infame Rig Tools"
+    def draw(self, context):
+        layout = self.layout; wm = context.window_manager
+        layout.prop(wm, "infame_instrumentation", text="Record Timings")
+        if not wm.infame_instrumentation: return
+        row = layout.row(align=True)
+        row.operator("infame.profile_next", icon='TIME')
+        if _instrument["profile_remaining"] or _instrument["profiled"]: row.label(text=f"{_instrument['profiled']} profiled, {_instrument['profile_remaining']} left")
+        stats = sorted(instrumentation_stats().items(), key=lambda item: -item[1][0] * item[1][1])
+        col = layout.column(align=True)
+        if not stats: col.label(text="No calls recorded yet")
+        for (name, method), (calls, mean, peak, ids) in stats[:12]:
+            row = col.row(align=True)
+            row.label(text=f"{name.split('_', 2)[-1]}.{method}"); row.label(text=f"{calls}x {mean:.2f} ms (max {peak:.1f})"); row.label(text=f"{ids} IDs")
+        row = layout.row(align=True)
+        row.operator("infame.reset_instrumentation", icon='X')
+        row.operator("infame.dump_instrumentation", icon='EXPORT')
 
 # ---- Registration ----
 
@@ -433,32 +1610,68 @@ classes = (
     INFAME_OT_clear_prefix,
     INFAME_OT_set_suffix,
     INFAME_OT_clear_suffix,
+    INFAME_OT_batch_rename,
     INFAME_OT_toggle_in_front,
     INFAME_OT_set_display_type,
     INFAME_OT_toggle_wire_overlay,
     INFAME_OT_set_armature_display,
+    INFAME_OT_performance_display,
     INFAME_OT_invert_current_driver,
     INFAME_OT_convert_driver_curve,
+    INFAME_OT_simplify_driver_curve,
+    INFAME_OT_optimize_driver_expressions,
     INFAME_OT_live_parenting,
+    INFAME_OT_auto_parent,
+    INFAME_OT_symmetrize_bone_names,
     INFAME_OT_flip_driver,
+    INFAME_OT_flip_all_drivers,
+    INFAME_OT_mirror_drivers,
+    InfameDriverReportItem,
+    INFAME_OT_scan_drivers,
+    INFAME_OT_export_driver_report,
+    INFAME_UL_driver_report,
     INFAME_PT_rig_tools,
+    INFAME_PT_driver_report,
+    INFAME_OT_profile_next,
+    INFAME_OT_reset_instrumentation,
+    INFAME_OT_dump_instrumentation,
+    INFAME_PT_instrumentation,
 )
 
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.infame_rig_tools = bpy.props.PointerProperty(type=InfameRigToolsProperties)
+    bpy.types.WindowManager.infame_driver_report = bpy.props.CollectionProperty(type=InfameDriverReportItem)
+    bpy.types.WindowManager.infame_driver_report_index = bpy.props.IntProperty()
+    bpy.types.WindowManager.infame_instrumentation = bpy.props.BoolProperty(name="Instrumentation", description="Record timings of Infame Rig Tools and Mesh Coding operators and panels", default=False, update=_update_instrumentation)
+    for name in _DRIVER_INDEX_HANDLERS: getattr(bpy.app.handlers, name).append(_invalidate_driver_index_handler)
+    bpy.app.handlers.depsgraph_update_post.append(_invalidate_updated_driver_index_handler)
+    bpy.app.handlers.load_post.append(_sync_instrumentation_handler)
     bpy.types.UI_MT_button_context_menu.append(draw_driver_context_menu)
     bpy.types.UI_MT_button_context_menu.append(draw_flip_driver_menu)
+    bpy.types.GRAPH_MT_channel_context_menu.append(draw_drivers_editor_menu)
     bpy.types.VIEW3D_MT_object_parent.append(draw_live_parenting_in_object_menu)
     bpy.types.VIEW3D_MT_edit_armature_parent.append(draw_live_parenting_in_object_menu)
 
 def unregister():
+    disable_instrumentation()
+    if _sync_instrumentation_handler in bpy.app.handlers.load_post: bpy.app.handlers.load_post.remove(_sync_instrumentation_handler)
+    for name in _DRIVER_INDEX_HANDLERS:
+        handlers = getattr(bpy.app.handlers, name)
+        if _invalidate_driver_index_handler in handlers: handlers.remove(_invalidate_driver_index_handler)
+    if _invalidate_updated_driver_index_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_invalidate_updated_driver_index_handler)
+    _driver_index.clear()
     bpy.types.UI_MT_button_context_menu.remove(draw_driver_context_menu)
     bpy.types.UI_MT_button_context_menu.remove(draw_flip_driver_menu)
+    bpy.types.GRAPH_MT_channel_context_menu.remove(draw_drivers_editor_menu)
     bpy.types.VIEW3D_MT_object_parent.remove(draw_live_parenting_in_object_menu)
     bpy.types.VIEW3D_MT_edit_armature_parent.remove(draw_live_parenting_in_object_menu)
     del bpy.types.Scene.infame_rig_tools
+    del bpy.types.WindowManager.infame_driver_report
+    del bpy.types.WindowManager.infame_driver_report_index
+    del bpy.types.WindowManager.infame_instrumentation
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
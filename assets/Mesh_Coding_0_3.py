@@ -4,21 +4,400 @@ bl_info = {
     "version": (0, 3),
     "blender": (4, 0, 0),
     "location": "View3D > Sidebar > Tool / Infame Rig Tools",
-    "description": "Convert mesh to JSON and assign to bone. Integrates with Infame Rig Tools if available.",
+    "description": "Convert mesh to JSON or binary and assign to bone. Integrates with Infame Rig Tools if available.",
     "category": "Development"
 }
 
 import bpy
+import fnmatch
+import hashlib
 import json
-from bpy.props import StringProperty
-from bpy.types import Operator, Panel
+import mmap
+import os
+import re
+import struct
+import threading
+import numpy as np
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from bpy.props import StringProperty, EnumProperty, BoolProperty, PointerProperty
+from bpy.types import Operator, Panel, PropertyGroup
+from bpy.app.handlers import persistent
+
+# Binary layout: header, then float32 vertex coords (3 per vertex), int32 edge vertex pairs,
+# int32 face sizes and int32 face loop vertex indices. All little-endian.
+BINARY_MAGIC = b"MCSH"
+BINARY_VERSION = 1
+BINARY_EXT = ".mcsh"
+_BINARY_HEADER = struct.Struct("<4sHHIIII")
+
+def write_mesh_binary(filepath, mesh):
+    vert_count = len(mesh.vertices)
+    edge_count = len(mesh.edges)
+    face_count = len(mesh.polygons)
+    loop_count = len(mesh.loops)
+
+    coords = np.empty(vert_count * 3, dtype="<f4")
+    mesh.vertices.foreach_get("co", coords)
+    edges = np.empty(edge_count * 2, dtype="<i4")
+    mesh.edges.foreach_get("vertices", edges)
+    face_sizes = np.empty(face_count, dtype="<i4")
+    mesh.polygons.foreach_get("loop_total", face_sizes)
+    loops = np.empty(loop_count, dtype="<i4")
+    mesh.loops.foreach_get("vertex_index", loops)
+
+    with open(filepath, 'wb') as f:
+        f.write(_BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, vert_count, edge_count, face_count, loop_count))
+        for array in (coords, edges, face_sizes, loops):
+            f.write(array.tobytes())
+
+def fill_mesh(mesh, coords, edges, face_sizes=None, loops=None):
+    mesh.vertices.add(len(coords) // 3)
+    mesh.vertices.foreach_set("co", coords)
+    mesh.edges.add(len(edges) // 2)
+    mesh.edges.foreach_set("vertices", edges)
+    face_count = 0 if face_sizes is None else len(face_sizes)
+    if face_count:
+        loop_starts = np.zeros(face_count, dtype=np.int32)
+        np.cumsum(face_sizes[:-1], out=loop_starts[1:])
+        mesh.loops.add(len(loops))
+        mesh.loops.foreach_set("vertex_index", loops)
+        mesh.polygons.add(face_count)
+        mesh.polygons.foreach_set("loop_start", loop_starts)
+
+def _binary_arrays(buffer):
+    if len(buffer) < _BINARY_HEADER.size:
+        raise ValueError("Truncated Mesh Coding binary file")
+    magic, version, _flags, vert_count, edge_count, face_count, loop_count = _BINARY_HEADER.unpack_from(buffer, 0)
+    if magic != BINARY_MAGIC or version > BINARY_VERSION:
+        raise ValueError("Not a Mesh Coding binary file")
+    if min(vert_count, edge_count, face_count, loop_count) < 0:
+        raise ValueError("Corrupt Mesh Coding binary header")
+
+    offset = _BINARY_HEADER.size
+    coords = np.frombuffer(buffer, dtype="<f4", count=vert_count * 3, offset=offset)
+    offset += coords.nbytes
+    edges = np.frombuffer(buffer, dtype="<i4", count=edge_count * 2, offset=offset)
+    offset += edges.nbytes
+    face_sizes = np.frombuffer(buffer, dtype="<i4", count=face_count, offset=offset)
+    offset += face_sizes.nbytes
+    loops = np.frombuffer(buffer, dtype="<i4", count=loop_count, offset=offset)
+    return coords, edges, face_sizes, loops
+
+def _fill_mesh_from_buffer(mesh, buffer):
+    fill_mesh(mesh, *_binary_arrays(buffer))
+
+def read_mesh_binary(filepath, name):
+    mesh = bpy.data.meshes.new(name)
+    with open(filepath, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        # The arrays are views into the map; they are released when the helper returns, before the map closes.
+        _fill_mesh_from_buffer(mesh, buffer)
+    mesh.update(calc_edges=True)
+    mesh.validate()
+    return mesh
+
+def is_mesh_binary(filepath):
+    with open(filepath, 'rb') as f:
+        return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+# Streaming JSON. The writer emits vertex/edge counts ahead of the arrays so the reader can
+# preallocate; files without counts (older exports) are read into growing chunk lists instead.
+JSON_CHUNK_ROWS = 4096
+JSON_READ_SIZE = 1 << 20
+_JSON_FIELD_RE = re.compile(r'"(vertices|edges|vertex_count|edge_count)"\s*:\s*(\[|-?\d+)')
+_JSON_ARRAY_END_RE = re.compile(r'\]\s*\]')
+_JSON_BRACKETS = str.maketrans("[]", "  ")
+_JSON_ARRAYS = {"vertices": (np.float32, 3, "vertex_count"), "edges": (np.int32, 2, "edge_count")}
+
+def _write_json_rows(f, rows, row_format, separator):
+    for start in range(0, len(rows), JSON_CHUNK_ROWS):
+        chunk = rows[start:start + JSON_CHUNK_ROWS]
+        if start:
+            f.write(separator)
+        f.write(separator.join([row_format] * len(chunk)) % tuple(chunk.ravel().tolist()))
+
+def write_mesh_json(filepath, mesh, pretty=True):
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+
+    # %.9g keeps float32 coordinates exact while staying shorter than repr().
+    if pretty:
+        head, mid, tail, separator = '{\n  "vertex_count": %d,\n  "edge_count": %d,\n  "vertices": [\n    ', '\n  ],\n  "edges": [\n    ', '\n  ]\n}\n', ",\n    "
+        vert_format, edge_format = "[%.9g, %.9g, %.9g]", "[%d, %d]"
+    else:
+        head, mid, tail, separator = '{"vertex_count":%d,"edge_count":%d,"vertices":[', '],"edges":[', ']}', ","
+        vert_format, edge_format = "[%.9g,%.9g,%.9g]", "[%d,%d]"
+
+    with open(filepath, 'w') as f:
+        f.write(head % (len(mesh.vertices), len(mesh.edges)))
+        _write_json_rows(f, coords.reshape(-1, 3), vert_format, separator)
+        f.write(mid)
+        _write_json_rows(f, edges.reshape(-1, 2), edge_format, separator)
+        f.write(tail)
+
+class _ArrayBuffer:
+    def __init__(self, dtype, size=None):
+        self.dtype = dtype
+        self.array = np.empty(size, dtype=dtype) if size is not None else None
+        self.parts = []
+        self.filled = 0
+
+    def extend(self, text):
+        if not text.strip():
+            return
+        values = np.fromstring(text.translate(_JSON_BRACKETS), dtype=np.float64, sep=",")
+        end = self.filled + len(values)
+        if self.array is not None and end <= len(self.array):
+            self.array[self.filled:end] = values
+        else:
+            if self.array is not None:
+                self.parts.append(self.array[:self.filled])
+                self.array = None
+            self.parts.append(values.astype(self.dtype))
+        self.filled = end
+
+    def result(self):
+        if self.array is not None:
+            return self.array[:self.filled]
+        return np.concatenate(self.parts) if self.parts else np.empty(0, dtype=self.dtype)
+
+def read_json_arrays(filepath):
+    counts = {}
+    arrays = {}
+    with open(filepath, 'r') as f:
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def refill():
+            nonlocal buffer, pos, eof
+            data = f.read(JSON_READ_SIZE)
+            eof = not data
+            buffer = buffer[pos:] + data
+            pos = 0
+
+        refill()
+        while True:
+            m = _JSON_FIELD_RE.search(buffer, pos)
+            if not m or (m.end() == len(buffer) and not eof):
+                if eof:
+                    break
+                # Keep a tail in case a key is split across reads.
+                pos = m.start() if m else max(pos, len(buffer) - 64)
+                refill()
+                continue
+
+            key, value = m.groups()
+            pos = m.end()
+            if value != "[":
+                counts[key] = int(value)
+                continue
+            if key not in _JSON_ARRAYS:
+                continue
+
+            dtype, width, count_key = _JSON_ARRAYS[key]
+            size = counts[count_key] * width if count_key in counts else None
+            values = _ArrayBuffer(dtype, size)
+            while True:
+                stripped = buffer[pos:].lstrip()
+                if not stripped and not eof:
+                    refill()
+                    continue
+                if stripped.startswith("]"):
+                    pos = len(buffer) - len(stripped) + 1
+                    break
+                end = _JSON_ARRAY_END_RE.search(buffer, pos)
+                if end:
+                    values.extend(buffer[pos:end.start() + 1])
+                    pos = end.end()
+                    break
+                cut = buffer.rfind(",", pos)
+                if cut > pos:
+                    values.extend(buffer[pos:cut])
+                    pos = cut + 1
+                if eof:
+                    raise ValueError(f"Unterminated '{key}' array")
+                refill()
+            arrays[key] = values.result()
+
+    if "vertices" not in arrays:
+        raise ValueError("No 'vertices' array found")
+    return arrays["vertices"], arrays.get("edges", np.empty(0, dtype=np.int32))
+
+def read_mesh_json(filepath, name):
+    coords, edges = read_json_arrays(filepath)
+    return mesh_from_arrays(name, coords, edges)
+
+def check_shape_arrays(coords, edges, face_sizes=None, loops=None):
+    # foreach_set raises on malformed arrays, so bad files are rejected before any mesh is created.
+    if len(coords) % 3 or len(edges) % 2:
+        raise ValueError("Vertices need 3 and edges 2 components")
+    if len(edges) and (edges.min() < 0 or edges.max() >= len(coords) // 3):
+        raise ValueError("Edge refers to a missing vertex")
+    if face_sizes is not None and int(face_sizes.sum()) != len(loops):
+        raise ValueError("Face sizes do not match the loop count")
+    return coords, edges, face_sizes, loops
+
+def load_shape_arrays(filepath):
+    # Touches no bpy data, so it can run on worker threads.
+    if is_mesh_binary(filepath):
+        with open(filepath, 'rb') as f:
+            return check_shape_arrays(*_binary_arrays(f.read()))
+    coords, edges = read_json_arrays(filepath)
+    return check_shape_arrays(coords, edges)
+
+def mesh_from_arrays(name, coords, edges, face_sizes=None, loops=None):
+    mesh = bpy.data.meshes.new(name)
+    try:
+        fill_mesh(mesh, coords, edges, face_sizes, loops)
+    except (RuntimeError, TypeError, ValueError):
+        bpy.data.meshes.remove(mesh)
+        raise
+    mesh.update(calc_edges=True)
+    mesh.validate()
+    return mesh
+
+def read_mesh_file(filepath, name):
+    if is_mesh_binary(filepath):
+        return read_mesh_binary(filepath, name)
+    return read_mesh_json(filepath, name)
+
+# Shape cache. Widget objects carry the hash of their geometry in a custom property so identical
+# shapes can be found again after the file is saved and reopened; file hashes are remembered by
+# path, mtime and size so unchanged files are not parsed twice.
+SHAPE_HASH_PROP = "meshcoding_hash"
+_file_hashes = {}
+_shape_objects = {}
+_shape_index_valid = False
+
+def geometry_hash(coords, edges, face_sizes=None, loops=None):
+    digest = hashlib.blake2b(digest_size=16)
+    for array, dtype in ((coords, "<f4"), (edges, "<i4"), (face_sizes, "<i4"), (loops, "<i4")):
+        array = np.empty(0, dtype=dtype) if array is None else np.ascontiguousarray(array, dtype=dtype)
+        digest.update(struct.pack("<I", len(array)))
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+def mesh_geometry_hash(mesh):
+    coords = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", coords)
+    edges = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edges)
+    face_sizes = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("loop_total", face_sizes)
+    loops = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loops)
+    return geometry_hash(coords, edges, face_sizes, loops)
+
+def _stat_key(path):
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+def _file_key(filepath):
+    return _stat_key(os.path.abspath(bpy.path.abspath(filepath)))
+
+def _rebuild_shape_index():
+    global _shape_index_valid
+    _shape_objects.clear()
+    for candidate in bpy.data.objects:
+        tag = candidate.get(SHAPE_HASH_PROP)
+        if tag and candidate.type == 'MESH':
+            _shape_objects.setdefault(tag, []).append(candidate.name)
+    _shape_index_valid = True
+
+@persistent
+def _invalidate_shape_index(*_args):
+    global _shape_index_valid
+    _shape_index_valid = False
+
+def find_shape_object(shape_hash, _retry=True):
+    if not _shape_index_valid:
+        _rebuild_shape_index()
+    renamed = False
+    for name in list(_shape_objects.get(shape_hash, ())):
+        obj = bpy.data.objects.get(name)
+        if obj is None or obj.get(SHAPE_HASH_PROP) != shape_hash:
+            renamed = True
+            continue
+        if mesh_geometry_hash(obj.data) == shape_hash:
+            return obj
+        # The widget's mesh was edited after it was tagged, so the tag no longer describes it.
+        _shape_objects[shape_hash].remove(name)
+        if obj.library is None:
+            del obj[SHAPE_HASH_PROP]
+    if renamed and _retry:
+        # A widget was renamed or deleted since the index was built.
+        _rebuild_shape_index()
+        return find_shape_object(shape_hash, _retry=False)
+    return None
+
+def register_shape_object(obj, shape_hash):
+    obj[SHAPE_HASH_PROP] = shape_hash
+    names = _shape_objects.setdefault(shape_hash, [])
+    if obj.name in names:
+        names.remove(obj.name)
+    names.insert(0, obj.name)
+
+def cached_shape_object(key):
+    shape_hash = _file_hashes.get(key)
+    return find_shape_object(shape_hash) if shape_hash else None
+
+def adopt_shape_mesh(key, mesh, name, collection):
+    shape_hash = mesh_geometry_hash(mesh)
+    _file_hashes[key] = shape_hash
+    obj = find_shape_object(shape_hash)
+    if obj:
+        bpy.data.meshes.remove(mesh)
+        return obj, True
+
+    obj = bpy.data.objects.new(name, mesh)
+    collection.objects.link(obj)
+    register_shape_object(obj, shape_hash)
+    return obj, False
+
+def get_or_create_shape(filepath, name, collection):
+    key = _file_key(filepath)
+    obj = cached_shape_object(key)
+    if obj:
+        return obj, True
+    return adopt_shape_mesh(key, read_mesh_file(key[0], "imported_shape"), name, collection)
+
+def export_shape(obj, filepath, file_format='JSON', pretty=True):
+    if file_format == 'BINARY':
+        write_mesh_binary(filepath, obj.data)
+    else:
+        write_mesh_json(filepath, obj.data, pretty=pretty)
+
+def assign_shape(bones, filepath, collection, name=None):
+    shape_obj, reused = get_or_create_shape(filepath, name or "shape_" + bones[0].name, collection)
+    for bone in bones:
+        bone.custom_shape = shape_obj
+    return shape_obj, reused
 
 class MESHCODING_OT_export_to_json(Operator):
     bl_idname = "meshcoding.export_to_json"
     bl_label = "Export Mesh to JSON"
-    bl_description = "Save selected mesh as JSON (vertices/edges)"
+    bl_description = "Save selected mesh as JSON (vertices/edges) or compact binary"
 
     filepath: StringProperty(subtype='FILE_PATH')
+    file_format: EnumProperty(
+        name="Format",
+        items=[
+            ('JSON', "JSON", "Human-readable vertices/edges, easy to edit by hand"),
+            ('BINARY', "Binary", "Compact packed vertices/edges/faces, fast to load"),
+        ],
+        default='JSON'
+    )
+    json_style: EnumProperty(
+        name="JSON Style",
+        items=[
+            ('PRETTY', "Pretty", "One vertex/edge per line"),
+            ('COMPACT', "Compact", "No whitespace, smallest JSON file"),
+        ],
+        default='PRETTY'
+    )
 
     def execute(self, context):
         obj = context.active_object
@@ -26,17 +405,18 @@ class MESHCODING_OT_export_to_json(Operator):
             self.report({'ERROR'}, "Select a MESH object")
             return {'CANCELLED'}
 
-        mesh_data = {
-            "vertices": [list(v.co) for v in obj.data.vertices],
-            "edges": [list(e.vertices) for e in obj.data.edges]
-        }
-
-        with open(self.filepath, 'w') as f:
-            json.dump(mesh_data, f, indent=2)
-
+        export_shape(obj, self.filepath, self.file_format, pretty=self.json_style == 'PRETTY')
         self.report({'INFO'}, f"Saved: {self.filepath}")
         return {'FINISHED'}
 
+    def check(self, context):
+        ext = BINARY_EXT if self.file_format == 'BINARY' else ".json"
+        root, old_ext = os.path.splitext(self.filepath)
+        if old_ext.lower() in {".json", BINARY_EXT} and old_ext.lower() != ext:
+            self.filepath = root + ext
+            return True
+        return False
+
     def invoke(self, context, event):
         context.window_manager.fileselect_add(self)
         return {'RUNNING_MODAL'}
@@ -44,7 +424,7 @@ class MESHCODING_OT_export_to_json(Operator):
 class MESHCODING_OT_import_to_bone(Operator):
     bl_idname = "meshcoding.import_to_bone"
     bl_label = "Shape to Bone"
-    bl_description = "Add a custom shape key from a .JSON file"
+    bl_description = "Add a custom shape key from a .JSON or binary shape file"
 
     filepath: StringProperty(subtype='FILE_PATH')
 
@@ -55,17 +435,12 @@ class MESHCODING_OT_import_to_bone(Operator):
             return {'CANCELLED'}
 
         try:
-            with open(self.filepath, 'r') as f:
-                mesh_data = json.load(f)
-
-            mesh = bpy.data.meshes.new("imported_shape")
-            mesh.from_pydata(mesh_data["vertices"], mesh_data["edges"], [])
+            shape_obj, reused = assign_shape([bone], self.filepath, context.collection)
 
-            shape_obj = bpy.data.objects.new("shape_" + bone.name, mesh)
-            bpy.context.collection.objects.link(shape_obj)
-            bone.custom_shape = shape_obj
-
-            self.report({'INFO'}, f"Shape assigned to {bone.name}")
+            if reused:
+                self.report({'INFO'}, f"Shape {shape_obj.name} reused for {bone.name}")
+            else:
+                self.report({'INFO'}, f"Shape assigned to {bone.name}")
             return {'FINISHED'}
 
         except Exception as e:
@@ -76,6 +451,431 @@ class MESHCODING_OT_import_to_bone(Operator):
         context.window_manager.fileselect_add(self)
         return {'RUNNING_MODAL'}
 
+SHAPE_EXTENSIONS = {".json", BINARY_EXT}
+SHAPE_MANIFEST_NAME = "shapes_manifest.json"
+SHAPE_LOAD_WORKERS = min(8, os.cpu_count() or 1)
+
+def is_shape_file(filename):
+    if filename.startswith(".") or filename == SHAPE_MANIFEST_NAME:
+        return False
+    return os.path.splitext(filename)[1].lower() in SHAPE_EXTENSIONS
+
+def scan_shape_directory(directory):
+    files = {}
+    for entry in os.scandir(directory):
+        if entry.is_file() and is_shape_file(entry.name):
+            files.setdefault(os.path.splitext(entry.name)[0], entry.path)
+    return files
+
+def match_shape_files(bone_names, files, rule, pattern="", replacement="", manifest=None):
+    lower_files = {stem.lower(): path for stem, path in files.items()}
+    regex = re.compile(pattern) if rule == 'REGEX' else None
+    matches = {}
+    for name in bone_names:
+        if rule == 'MANIFEST':
+            stem = next((value for glob, value in manifest.items() if fnmatch.fnmatchcase(name, glob)), None)
+            if stem is not None:
+                stem = os.path.splitext(stem)[0]
+        elif rule == 'REGEX':
+            m = regex.fullmatch(name)
+            stem = m.expand(replacement) if m else None
+        else:
+            stem = name
+        if stem is None:
+            continue
+        path = files.get(stem) or lower_files.get(stem.lower())
+        if path:
+            matches[name] = path
+    return matches
+
+def assign_shapes_from_directory(bones, directory, collection, rule='NAME', pattern="", replacement="",
+                                 manifest=SHAPE_MANIFEST_NAME, progress=None):
+    """Assign matching shape files to pose bones; returns (assigned, shapes, failed) where failed lists
+    "path: error" for every file that could not be read."""
+    files = scan_shape_directory(directory)
+    manifest_data = None
+    if rule == 'MANIFEST':
+        with open(os.path.join(directory, manifest), 'r') as f:
+            manifest_data = json.load(f)
+    matches = match_shape_files([b.name for b in bones], files, rule, pattern, replacement, manifest_data)
+
+    keys = {path: _file_key(path) for path in set(matches.values())}
+    shapes = {}
+    pending = []
+    for path, key in keys.items():
+        obj = cached_shape_object(key)
+        if obj:
+            shapes[path] = obj
+        else:
+            pending.append(path)
+
+    # Parsing runs on worker threads; creating meshes and objects stays on the main thread.
+    failed = []
+    with ThreadPoolExecutor(max_workers=SHAPE_LOAD_WORKERS) as pool:
+        futures = {pool.submit(load_shape_arrays, path): path for path in pending}
+        for done, future in enumerate(as_completed(futures), 1):
+            path = futures[future]
+            try:
+                mesh = mesh_from_arrays("imported_shape", *future.result())
+            except (OSError, RuntimeError, TypeError, ValueError) as e:
+                failed.append(f"{path}: {e}")
+            else:
+                stem = os.path.splitext(os.path.basename(path))[0]
+                shapes[path], _reused = adopt_shape_mesh(keys[path], mesh, "shape_" + stem, collection)
+            if progress:
+                progress(done / len(pending))
+
+    assigned = 0
+    for bone in bones:
+        obj = shapes.get(matches.get(bone.name))
+        if obj:
+            bone.custom_shape = obj
+            assigned += 1
+    return assigned, len(shapes), failed
+
+class MESHCODING_OT_import_directory_to_bones(Operator):
+    bl_idname = "meshcoding.import_directory_to_bones"
+    bl_label = "Shapes to Bones"
+    bl_description = "Assign shapes from a directory to every selected pose bone using a name rule"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    directory: StringProperty(subtype='DIR_PATH')
+    rule: EnumProperty(
+        name="Rule",
+        items=[
+            ('NAME', "Bone Name", "File name equals the bone name"),
+            ('REGEX', "Regex", "Bone name matched by a regex, file name built from the replacement"),
+            ('MANIFEST', "Manifest", "Bone name globs mapped to files in a JSON manifest in the directory"),
+        ],
+        default='NAME'
+    )
+    pattern: StringProperty(
+        name="Pattern",
+        description="Regex matched against the full bone name",
+        default=r"(?:CTRL_)?(.+?)(?:[._-][LR])?"
+    )
+    replacement: StringProperty(
+        name="Replacement",
+        description="File name built from the regex groups",
+        default=r"\1"
+    )
+    manifest: StringProperty(
+        name="Manifest",
+        description="JSON file in the directory mapping bone name globs to shape files",
+        default=SHAPE_MANIFEST_NAME
+    )
+
+    def execute(self, context):
+        bones = context.selected_pose_bones or []
+        if not bones:
+            self.report({'ERROR'}, "Select bones in POSE mode")
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        wm.progress_begin(0, 1)
+        try:
+            assigned, shapes, failed = assign_shapes_from_directory(
+                bones, bpy.path.abspath(self.directory), context.collection, self.rule,
+                self.pattern, self.replacement, self.manifest, progress=wm.progress_update)
+        except (OSError, ValueError, re.error) as e:
+            self.report({'ERROR'}, f"Error: {str(e)}")
+            return {'CANCELLED'}
+        finally:
+            wm.progress_end()
+
+        for failure in failed:
+            self.report({'WARNING'}, f"Could not read {failure}")
+        level = {'WARNING'} if failed or assigned < len(bones) else {'INFO'}
+        self.report(level, f"{assigned}/{len(bones)} bones assigned from {shapes} shapes, {len(failed)} files failed")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+
+# ---- Shape Library ----
+# A library is a directory tree of shape files with an index file at its root. The index keeps
+# per-file stats (counts, bounds, hash) so the panel can browse and search without parsing
+# anything; geometry is only loaded on assignment, through a size-bounded LRU cache.
+LIBRARY_INDEX_NAME = ".meshcoding_index.json"
+LIBRARY_INDEX_VERSION = 1
+LIBRARY_MAX_RESULTS = 20
+GEOMETRY_CACHE_BYTES = 64 * 1024 * 1024
+
+class GeometryCache:
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.items = OrderedDict()
+        self.nbytes = 0
+        self.lock = threading.Lock()
+
+    def get(self, filepath):
+        # Expects an absolute path; this runs on worker threads and must not touch bpy.
+        key = _stat_key(filepath)
+        with self.lock:
+            entry = self.items.get(key)
+            if entry is not None:
+                self.items.move_to_end(key)
+                return entry[0]
+
+        arrays = load_shape_arrays(key[0])
+        size = sum(a.nbytes for a in arrays if a is not None)
+        with self.lock:
+            if key not in self.items:
+                self.items[key] = (arrays, size)
+                self.nbytes += size
+            while self.nbytes > self.max_bytes and len(self.items) > 1:
+                _old_key, (_old_arrays, old_size) = self.items.popitem(last=False)
+                self.nbytes -= old_size
+        return arrays
+
+    def clear(self):
+        with self.lock:
+            self.items.clear()
+            self.nbytes = 0
+
+geometry_cache = GeometryCache(GEOMETRY_CACHE_BYTES)
+
+def _library_entry(root, relpath, stat):
+    coords, edges, face_sizes, loops = geometry_cache.get(os.path.join(root, relpath))
+    points = coords.reshape(-1, 3)
+    folder, filename = os.path.split(relpath)
+    return {
+        "name": os.path.splitext(filename)[0],
+        "tags": [part.lower() for part in folder.split("/") if part],
+        "vertex_count": len(points),
+        "edge_count": len(edges) // 2,
+        "bounds": [points.min(axis=0).tolist(), points.max(axis=0).tolist()] if len(points) else None,
+        "hash": geometry_hash(coords, edges, face_sizes, loops),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+
+def read_library_index(root):
+    try:
+        with open(os.path.join(root, LIBRARY_INDEX_NAME), 'r') as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if index.get("version") != LIBRARY_INDEX_VERSION:
+        return {}
+    return index.get("entries", {})
+
+def refresh_library_index(root):
+    """Index new and changed shape files under root; returns (total, updated, removed, failed) where
+    failed lists "file: error" for every file, including the index itself, that could not be processed."""
+    old_entries = read_library_index(root)
+    entries = {}
+    stale = {}
+    for folder, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for filename in filenames:
+            if not is_shape_file(filename):
+                continue
+            path = os.path.join(folder, filename)
+            relpath = os.path.relpath(path, root).replace(os.sep, "/")
+            stat = os.stat(path)
+            old = old_entries.get(relpath)
+            if old and old.get("mtime_ns") == stat.st_mtime_ns and old.get("size") == stat.st_size:
+                entries[relpath] = old
+            else:
+                stale[relpath] = stat
+
+    failed = []
+    with ThreadPoolExecutor(max_workers=SHAPE_LOAD_WORKERS) as pool:
+        futures = {pool.submit(_library_entry, root, relpath, stat): relpath for relpath, stat in stale.items()}
+        for future in as_completed(futures):
+            try:
+                entries[futures[future]] = future.result()
+            except (OSError, ValueError) as e:
+                failed.append(f"{futures[future]}: {e}")
+    updated = len(stale) - len(failed)
+
+    # A read-only library still gets searched, just from an index kept in memory.
+    try:
+        with open(os.path.join(root, LIBRARY_INDEX_NAME), 'w') as f:
+            json.dump({"version": LIBRARY_INDEX_VERSION, "entries": entries}, f, separators=(",", ":"), sort_keys=True)
+    except OSError as e:
+        failed.append(f"{LIBRARY_INDEX_NAME}: {e}")
+
+    removed = len(set(old_entries) - set(entries))
+    _library_state.update(root=root, entries=entries, search=None, results=[])
+    return len(entries), updated, removed, failed
+
+_library_state = {"root": None, "entries": {}, "search": None, "results": []}
+
+def library_entries(root):
+    if _library_state["root"] != root:
+        _library_state.update(root=root, entries=read_library_index(root), search=None, results=[])
+    return _library_state["entries"]
+
+def search_library(root, query):
+    entries = library_entries(root)
+    if _library_state["search"] != query:
+        terms = query.lower().split()
+        results = []
+        for relpath, entry in sorted(entries.items()):
+            text = " ".join([entry["name"].lower()] + entry["tags"])
+            if all(term in text for term in terms):
+                results.append(relpath)
+        _library_state.update(search=query, results=results)
+    return _library_state["results"]
+
+def draw_shape_library(layout, context):
+    props = context.scene.mesh_coding
+    box = layout.box()
+    row = box.row(align=True)
+    row.prop(props, "library_path", text="")
+    row.operator("meshcoding.refresh_library", text="", icon='FILE_REFRESH')
+    root = bpy.path.abspath(props.library_path)
+    if not props.library_path or not os.path.isdir(root):
+        box.label(text="Set a shape library directory")
+        return
+
+    box.prop(props, "library_search", text="", icon='VIEWZOOM')
+    results = search_library(root, props.library_search)
+    entries = _library_state["entries"]
+    if not entries:
+        box.label(text="Library not indexed, press refresh")
+        return
+
+    col = box.column(align=True)
+    for relpath in results[:LIBRARY_MAX_RESULTS]:
+        entry = entries[relpath]
+        row = col.row(align=True)
+        row.label(text=entry["name"], icon='MESH_DATA')
+        row.label(text=f"{entry['vertex_count']}v")
+        op = row.operator("meshcoding.assign_library_shape", text="", icon='BONE_DATA')
+        op.entry = relpath
+    if len(results) > LIBRARY_MAX_RESULTS:
+        box.label(text=f"{len(results) - LIBRARY_MAX_RESULTS} more, refine the search")
+
+class MeshCodingProperties(PropertyGroup):
+    library_path: StringProperty(
+        name="Shape Library",
+        description="Directory of shape files browsed by the library",
+        subtype='DIR_PATH',
+        default=""
+    )
+    library_search: StringProperty(
+        name="Search",
+        description="Filter library shapes by name and folder tags",
+        default=""
+    )
+
+class MESHCODING_OT_refresh_library(Operator):
+    bl_idname = "meshcoding.refresh_library"
+    bl_label = "Refresh Shape Library"
+    bl_description = "Index new and changed shape files in the library directory"
+
+    def execute(self, context):
+        root = bpy.path.abspath(context.scene.mesh_coding.library_path)
+        if not os.path.isdir(root):
+            self.report({'ERROR'}, "Shape library directory not found")
+            return {'CANCELLED'}
+
+        try:
+            total, updated, removed, failed = refresh_library_index(root)
+        except OSError as e:
+            self.report({'ERROR'}, f"Error: {str(e)}")
+            return {'CANCELLED'}
+
+        for failure in failed:
+            self.report({'WARNING'}, f"Could not index {failure}")
+        level = {'WARNING'} if failed else {'INFO'}
+        self.report(level, f"{total} shapes indexed, {updated} updated, {removed} removed, {len(failed)} failed")
+        return {'FINISHED'}
+
+class MESHCODING_OT_assign_library_shape(Operator):
+    bl_idname = "meshcoding.assign_library_shape"
+    bl_label = "Assign Library Shape"
+    bl_description = "Assign this library shape to the selected pose bones"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    entry: StringProperty()
+
+    def execute(self, context):
+        bones = context.selected_pose_bones or []
+        if not bones:
+            self.report({'ERROR'}, "Select bones in POSE mode")
+            return {'CANCELLED'}
+
+        path = os.path.join(bpy.path.abspath(context.scene.mesh_coding.library_path), self.entry)
+        try:
+            key = _file_key(path)
+            obj = cached_shape_object(key)
+            if not obj:
+                mesh = mesh_from_arrays("imported_shape", *geometry_cache.get(path))
+                stem = os.path.splitext(os.path.basename(path))[0]
+                obj, _reused = adopt_shape_mesh(key, mesh, "shape_" + stem, context.collection)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Error: {str(e)}")
+            return {'CANCELLED'}
+
+        for bone in bones:
+            bone.custom_shape = obj
+        self.report({'INFO'}, f"{obj.name} assigned to {len(bones)} bones")
+        return {'FINISHED'}
+
+class MESHCODING_OT_deduplicate_shapes(Operator):
+    bl_idname = "meshcoding.deduplicate_shapes"
+    bl_label = "Deduplicate Custom Shapes"
+    bl_description = "Make bones whose custom shapes have identical geometry share a single widget object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    delete_duplicates: BoolProperty(
+        name="Delete Duplicates",
+        description="Remove duplicate widget objects that no bone uses anymore",
+        default=True
+    )
+
+    def execute(self, context):
+        hashes = {}
+        canonical = {}
+        replaced = {}
+        bones = 0
+        for arm in bpy.data.objects:
+            if arm.type != 'ARMATURE' or not arm.pose:
+                continue
+            for pbone in arm.pose.bones:
+                shape = pbone.custom_shape
+                if not shape or shape.type != 'MESH':
+                    continue
+                key = shape.data.as_pointer()
+                if key not in hashes:
+                    hashes[key] = mesh_geometry_hash(shape.data)
+                shape_hash = hashes[key]
+                # Prefer a widget that is already tagged with this real geometry hash (stale tags are
+                # rejected by find_shape_object), otherwise the first one seen.
+                keep = canonical.get(shape_hash)
+                if keep is None:
+                    keep = find_shape_object(shape_hash) or shape
+                    canonical[shape_hash] = keep
+                    if keep.get(SHAPE_HASH_PROP) != shape_hash:
+                        register_shape_object(keep, shape_hash)
+                if shape != keep:
+                    replaced[shape.name] = shape
+                    pbone.custom_shape = keep
+                    bones += 1
+
+        removed = 0
+        if self.delete_duplicates and replaced:
+            in_use = {pbone.custom_shape.name for arm in bpy.data.objects if arm.type == 'ARMATURE' and arm.pose
+                      for pbone in arm.pose.bones if pbone.custom_shape}
+            for name, obj in replaced.items():
+                # Keep widgets that are still linked anywhere other than their collections (fake user,
+                # drivers, constraints, other data) or that have children.
+                if name in in_use or obj.children or obj.users > len(obj.users_collection):
+                    continue
+                mesh = obj.data
+                bpy.data.objects.remove(obj)
+                if mesh.users == 0:
+                    bpy.data.meshes.remove(mesh)
+                removed += 1
+
+        self.report({'INFO'}, f"{bones} bones remapped onto {len(canonical)} shapes, {removed} duplicates removed")
+        return {'FINISHED'}
+
 class VIEW3D_PT_mesh_coding(Panel):
     bl_label = "Mesh Coding"
     bl_space_type = 'VIEW_3D'
@@ -85,10 +885,15 @@ class VIEW3D_PT_mesh_coding(Panel):
     def draw(self, context):
         layout = self.layout
         layout.operator("meshcoding.export_to_json", text="Mesh to JSON", icon='FILE_TEXT')
+        op = layout.operator("meshcoding.export_to_json", text="Mesh to Binary", icon='FILE_BLANK')
+        op.file_format = 'BINARY'
 
         obj = context.object
         if obj and obj.type == 'ARMATURE' and context.mode == 'POSE' and obj.pose.bones:
             layout.operator("meshcoding.import_to_bone", text="Shape to Bone", icon='BONE_DATA')
+            layout.operator("meshcoding.import_directory_to_bones", text="Shapes to Bones", icon='FILE_FOLDER')
+            layout.operator("meshcoding.deduplicate_shapes", icon='DUPLICATE')
+            draw_shape_library(layout, context)
 
 def draw_json_to_bone_button(self, context):
     obj = context.object
@@ -104,27 +909,41 @@ def draw_json_to_bone_button(self, context):
         icon="BONE_DATA"
     )
     op.bl_description = "Add a custom shape key from a .JSON file"
+    box.operator("meshcoding.import_directory_to_bones", text="Shapes to Bones", icon="FILE_FOLDER")
+    draw_shape_library(box, context)
 
 classes = (
+    MeshCodingProperties,
     MESHCODING_OT_export_to_json,
     MESHCODING_OT_import_to_bone,
+    MESHCODING_OT_import_directory_to_bones,
+    MESHCODING_OT_deduplicate_shapes,
+    MESHCODING_OT_refresh_library,
+    MESHCODING_OT_assign_library_shape,
     VIEW3D_PT_mesh_coding,
 )
 
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    bpy.types.Scene.mesh_coding = PointerProperty(type=MeshCodingProperties)
+    bpy.app.handlers.load_post.append(_invalidate_shape_index)
 
     if hasattr(bpy.types, "INFAME_PT_rig_tools"):
         bpy.types.INFAME_PT_rig_tools.append(draw_json_to_bone_button)
 
 def unregister():
+    if _invalidate_shape_index in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(_invalidate_shape_index)
+
     if hasattr(bpy.types, "INFAME_PT_rig_tools"):
         try:
             bpy.types.INFAME_PT_rig_tools.remove(draw_json_to_bone_button)
         except:
             pass
 
+    geometry_cache.clear()
+    del bpy.types.Scene.mesh_coding
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
 
@@ -0,0 +1,254 @@
+"""Run Infame Rig Tools / Mesh Coding maintenance over many .blend files.
+
+Runs with any Python 3 outside Blender. Each .blend file is opened by its own
+`blender --background` worker, up to --jobs at a time, and every worker runs the
+same list of actions from a JSON file. A JSON report with per-file results is written
+at the end.
+
+    python infame_batch.py --blender /path/to/blender --actions fixes.json \\
+        --report report.json --jobs 16 shots/ assets/char_*.blend
+
+Actions file, a list of steps applied in order (object and bone fields are globs):
+
+    [
+        {"action": "flip_drivers", "objects": "RIG-*", "side": "ALL"},
+        {"action": "invert_drivers", "path_filter": "*smile*", "mode": "CURVE_ZERO"},
+        {"action": "convert_drivers", "interpolation": "LINEAR", "handle_type": "AUTO_CLAMPED"},
+        {"action": "simplify_drivers", "tolerance": 0.001},
+        {"action": "optimize_expressions"},
+        {"action": "rename_bones", "objects": "RIG-*", "bones": "*", "names": {"hand.L": "CTRL_hand.L"}},
+        {"action": "rename_objects", "objects": "WGT_*", "prefix": "", "find": "WGT_", "replace": "WGT-"},
+        {"action": "assign_shape", "objects": "RIG-*", "bones": "CTRL_hand*", "filepath": "//shapes/hand.mcsh"},
+        {"action": "assign_shapes", "objects": "RIG-*", "bones": "CTRL_*", "directory": "/lib/shapes", "rule": "NAME"},
+        {"action": "export_shapes", "objects": "WGT-*", "directory": "/lib/shapes", "format": "BINARY"}
+    ]
+
+Driver actions without "objects" act on every driver in the file. A file is saved only
+when every action succeeded, and never with --dry-run.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+RIG_TOOLS_MODULE = "InfameRigsTools_0_3_6"
+MESH_CODING_MODULE = "Mesh_Coding_0_3"
+WORKER_TIMEOUT = 30 * 60
+LOG_TAIL_LINES = 40
+
+# ---- Worker (inside Blender) ----
+
+def _objects(pattern, obj_type=None):
+    import bpy
+    return [obj for obj in bpy.data.objects
+            if fnmatch.fnmatchcase(obj.name, pattern or "*") and (obj_type is None or obj.type == obj_type)]
+
+def _pose_bones(step):
+    return [pbone for obj in _objects(step.get("objects"), 'ARMATURE') if obj.pose
+            for pbone in obj.pose.bones if fnmatch.fnmatchcase(pbone.name, step.get("bones", "*"))]
+
+def _drivers(irt, step):
+    objects = _objects(step["objects"]) if step.get("objects") else None
+    return irt.find_drivers(objects, step.get("path_filter", "*"))
+
+def _renamer(irt, step):
+    names = step.get("names")
+    if names:
+        return names.get
+    return lambda name: irt.compose_name(name, step.get("prefix", ""), step.get("suffix", ""),
+                                         step.get("find", ""), step.get("replace", ""))
+
+def run_action(irt, mc, step):
+    import bpy
+    action = step["action"]
+    if action == "flip_drivers":
+        drivers, flipped, unchanged, unresolved = irt.flip_drivers(_objects(step.get("objects"), 'ARMATURE'), step.get("side", 'ALL'))
+        return {"drivers": drivers, "flipped": flipped, "unchanged": unchanged, "unresolved": unresolved}
+    if action == "invert_drivers":
+        fcurves = _drivers(irt, step)
+        return {"drivers": len(fcurves), "inverted": sum(irt.invert_fcurve_keys(fc, step.get("mode", 'CURVE_ZERO')) for fc in fcurves)}
+    if action == "convert_drivers":
+        fcurves = _drivers(irt, step)
+        converted = sum(irt.convert_fcurve_keys(fc, step.get("interpolation"), step.get("handle_type")) for fc in fcurves)
+        return {"drivers": len(fcurves), "converted": converted}
+    if action == "simplify_drivers":
+        before = after = 0
+        max_deviation = 0.0
+        for fc in _drivers(irt, step):
+            b, a, deviation = irt.simplify_fcurve_keys(fc, step.get("tolerance", 0.001), step.get("handle_type", 'AUTO_CLAMPED'))
+            before += b
+            after += a
+            max_deviation = max(max_deviation, deviation)
+        return {"keyframes_before": before, "keyframes_after": after, "max_deviation": max_deviation}
+    if action == "optimize_expressions":
+        counts = {"REWRITTEN": 0, "SIMPLE": 0, "SKIPPED": 0, "FAILED": 0}
+        failed = []
+        for fc in _drivers(irt, step):
+            status, reason = irt.optimize_driver(fc, step.get("use_driver_types", True), step.get("samples", 64))
+            counts[status] += 1
+            if status == 'FAILED':
+                failed.append(f"{fc.id_data.name}: {fc.data_path}[{fc.array_index}] ({reason})")
+        return {"rewritten": counts["REWRITTEN"], "already_simple": counts["SIMPLE"], "failed": failed}
+    if action in ("rename_bones", "rename_objects"):
+        items = _pose_bones(step) if action == "rename_bones" else _objects(step.get("objects"))
+        renamed, rewritten, skipped = irt.rename_datablocks(items, _renamer(irt, step))
+        return {"renamed": renamed, "references_updated": rewritten, "conflicts": skipped}
+    if action == "assign_shape":
+        bones = _pose_bones(step)
+        if not bones:
+            return {"assigned": 0}
+        shape_obj, reused = mc.assign_shape(bones, bpy.path.abspath(step["filepath"]), bpy.context.scene.collection)
+        return {"assigned": len(bones), "shape": shape_obj.name, "reused": reused}
+    if action == "assign_shapes":
+        bones = _pose_bones(step)
+        assigned, shapes, failed = mc.assign_shapes_from_directory(
+            bones, bpy.path.abspath(step["directory"]), bpy.context.scene.collection, step.get("rule", 'NAME'),
+            step.get("pattern", ""), step.get("replacement", ""), step.get("manifest", mc.SHAPE_MANIFEST_NAME))
+        return {"bones": len(bones), "assigned": assigned, "shapes": shapes, "failed_files": failed}
+    if action == "export_shapes":
+        file_format = step.get("format", 'JSON')
+        ext = mc.BINARY_EXT if file_format == 'BINARY' else ".json"
+        directory = bpy.path.abspath(step["directory"])
+        os.makedirs(directory, exist_ok=True)
+        exported = []
+        for obj in _objects(step.get("objects"), 'MESH'):
+            path = os.path.join(directory, bpy.path.clean_name(obj.name) + ext)
+            mc.export_shape(obj, path, file_format, pretty=step.get("pretty", True))
+            exported.append(path)
+        return {"exported": exported}
+    raise ValueError(f"Unknown action '{action}'")
+
+def run_worker(actions_path, result_path, dry_run):
+    import bpy
+    import importlib
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    irt = importlib.import_module(RIG_TOOLS_MODULE)
+    mc = importlib.import_module(MESH_CODING_MODULE)
+    with open(actions_path, 'r') as f:
+        steps = json.load(f)
+
+    results = []
+    ok = True
+    for step in steps:
+        start = time.perf_counter()
+        try:
+            result = {"action": step.get("action"), "status": "ok", **run_action(irt, mc, step)}
+        except Exception as e:
+            result = {"action": step.get("action"), "status": "error", "error": f"{type(e).__name__}: {e}"}
+            ok = False
+        result["seconds"] = round(time.perf_counter() - start, 3)
+        results.append(result)
+
+    saved = False
+    if ok and not dry_run:
+        bpy.ops.wm.save_mainfile()
+        saved = True
+    with open(result_path, 'w') as f:
+        json.dump({"ok": ok, "saved": saved, "actions": results}, f)
+    return 0 if ok else 1
+
+# ---- Runner (outside Blender) ----
+
+def collect_blend_files(paths):
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _dirs, names in os.walk(path):
+                files.extend(os.path.join(root, name) for name in sorted(names) if name.endswith(".blend"))
+        elif path.endswith(".blend"):
+            files.append(path)
+    return files
+
+def run_file(blender, blend_file, actions_path, dry_run, timeout):
+    fd, result_path = tempfile.mkstemp(suffix=".json", prefix="infame_batch_")
+    os.close(fd)
+    cmd = [blender, "--background", "--factory-startup", blend_file,
+           "--python", os.path.abspath(__file__), "--",
+           "--worker", "--actions", os.path.abspath(actions_path), "--result", result_path]
+    if dry_run:
+        cmd.append("--dry-run")
+    entry = {"file": blend_file}
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, timeout=timeout)
+        entry["returncode"] = proc.returncode
+        log = proc.stdout
+        try:
+            with open(result_path, 'r') as f:
+                entry.update(json.load(f))
+        except (OSError, ValueError):
+            entry["ok"] = False
+            entry["error"] = "worker produced no result"
+        entry["status"] = "ok" if entry.get("ok") and proc.returncode == 0 else "error"
+    except OSError as e:
+        entry["status"] = "error"
+        entry["error"] = str(e)
+        log = ""
+    except subprocess.TimeoutExpired as e:
+        entry["status"] = "timeout"
+        log = e.stdout.decode(errors="replace") if isinstance(e.stdout, bytes) else (e.stdout or "")
+    finally:
+        os.remove(result_path)
+    entry["seconds"] = round(time.perf_counter() - start, 3)
+    if entry["status"] != "ok":
+        entry["log_tail"] = log.splitlines()[-LOG_TAIL_LINES:]
+    return entry
+
+def run_batch(blender, files, actions_path, jobs, dry_run=False, timeout=WORKER_TIMEOUT):
+    # Each worker is a separate Blender process; the threads here only wait on them.
+    entries = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_file, blender, path, actions_path, dry_run, timeout) for path in files]
+        for done, future in enumerate(as_completed(futures), 1):
+            entry = future.result()
+            entries.append(entry)
+            print(f"[{done}/{len(files)}] {entry['status']:7} {entry['seconds']:8.1f}s  {entry['file']}", flush=True)
+    entries.sort(key=lambda entry: entry["file"])
+    return entries
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Apply Infame Rig Tools actions to many .blend files in parallel.")
+    parser.add_argument("paths", nargs="*", help=".blend files or directories searched recursively")
+    parser.add_argument("--actions", required=True, help="JSON file with the list of actions")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable (default: $BLENDER or 'blender')")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Parallel Blender workers")
+    parser.add_argument("--report", default="infame_batch_report.json", help="JSON report path")
+    parser.add_argument("--timeout", type=float, default=WORKER_TIMEOUT, help="Seconds before a worker is killed")
+    parser.add_argument("--dry-run", action="store_true", help="Run the actions but do not save any file")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        return run_worker(args.actions, args.result, args.dry_run)
+
+    files = collect_blend_files(args.paths)
+    if not files:
+        parser.error("no .blend files found")
+    start = time.perf_counter()
+    entries = run_batch(args.blender, files, args.actions, max(1, args.jobs), args.dry_run, args.timeout)
+    failed = sum(entry["status"] != "ok" for entry in entries)
+    with open(args.actions, 'r') as f:
+        actions = json.load(f)
+    report = {
+        "actions": actions,
+        "dry_run": args.dry_run,
+        "seconds": round(time.perf_counter() - start, 3),
+        "summary": {"files": len(entries), "ok": len(entries) - failed, "failed": failed},
+        "files": entries,
+    }
+    with open(args.report, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"{len(entries) - failed}/{len(entries)} files ok, report: {args.report}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    # Inside Blender the script's own arguments follow "--".
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else None
+    sys.exit(main(argv))
@@ -0,0 +1,352 @@
+"""Benchmarks for Infame Rig Tools and Mesh Coding hot paths.
+
+Three commands:
+
+    # Pure-Python pieces (flip engine, expression optimizer, JSON/binary parsing), no Blender needed
+    python infame_bench.py micro --out micro.json
+
+    # Synthetic rigs and meshes inside Blender
+    blender --background --factory-startup --python infame_bench.py -- blender --scale medium --out rig.json
+
+    # Flag benchmarks that got slower than the baseline by more than the threshold
+    python infame_bench.py compare baseline.json current.json --threshold 0.15
+
+Scales (bones / drivers / widget vertices): small 1k / 1k / 10k, medium 10k / 5k / 200k,
+large 50k / 20k / 1M; --bones, --drivers and --verts override single values.
+Results are JSON with min/median/mean seconds per benchmark and can be kept as baselines.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import types
+
+ASSETS_DIR = os.path.dirname(os.path.abspath(__file__))
+RIG_TOOLS_MODULE = "InfameRigsTools_0_3_6"
+MESH_CODING_MODULE = "Mesh_Coding_0_3"
+
+SCALES = {
+    "small": {"bones": 1000, "drivers": 1000, "verts": 10_000},
+    "medium": {"bones": 10_000, "drivers": 5000, "verts": 200_000},
+    "large": {"bones": 50_000, "drivers": 20_000, "verts": 1_000_000},
+}
+DRIVER_KEYFRAMES = 32
+DEFAULT_THRESHOLD = 0.15
+
+def measure(fn, repeat=5, setup=None, teardown=None, items=None):
+    # setup/teardown run outside the timed region on every repeat.
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+        if teardown:
+            teardown()
+    result = {"min": min(times), "median": statistics.median(times), "mean": statistics.fmean(times), "repeat": repeat}
+    if items is not None:
+        result["items"] = items
+    return result
+
+def _meta(mode, **extra):
+    return {"mode": mode, "python": platform.python_version(), "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"), **extra}
+
+def _write_results(path, meta, results):
+    with open(path, 'w') as f:
+        json.dump({"meta": meta, "results": results}, f, indent=2)
+    for name, result in results.items():
+        print(f"{name:40} {result['median'] * 1000:12.3f} ms  (min {result['min'] * 1000:.3f})")
+    print(f"Results: {path}")
+
+# ---- Micro-benchmarks (no Blender) ----
+
+BLENDER_MODULES = ("bpy", "bpy.props", "bpy.types", "bpy.app", "bpy.app.handlers", "blf", "gpu", "gpu_extras",
+                   "gpu_extras.batch", "mathutils")
+MICRO_TARGETS = {
+    RIG_TOOLS_MODULE: ("_flip_token", "clear_flip_cache", "flip_path_universal", "flip_batch", "strip_side", "path_side",
+                       "compose_name", "optimize_expression", "expressions_equivalent", "rdp_keep_mask"),
+    MESH_CODING_MODULE: ("geometry_hash", "_BINARY_HEADER", "BINARY_MAGIC", "BINARY_VERSION", "_binary_arrays", "read_json_arrays"),
+}
+
+class _StubObject:
+    def __init__(self, *args, **kwargs):
+        pass
+
+class _BlenderStub(types.ModuleType):
+    # Stand-in for a Blender-only module: every attribute is a class accepting any arguments, so the addons'
+    # class definitions and property annotations import. Nothing from it is ever benchmarked.
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        value = type(name, (_StubObject,), {})
+        setattr(self, name, value)
+        return value
+
+def stub_blender_modules():
+    """Make the addons importable outside Blender. Does nothing when a real bpy is available."""
+    try:
+        import bpy  # noqa: F401
+        return
+    except ImportError:
+        pass
+    for name in BLENDER_MODULES:
+        sys.modules[name] = _BlenderStub(name)
+    for name in BLENDER_MODULES:
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, sys.modules[name])
+    sys.modules["bpy.app.handlers"].persistent = lambda func: func
+
+def load_addon(module_name):
+    stub_blender_modules()
+    if ASSETS_DIR not in sys.path:
+        sys.path.insert(0, ASSETS_DIR)
+    module = importlib.import_module(module_name)
+    missing = [name for name in MICRO_TARGETS.get(module_name, ()) if not hasattr(module, name)]
+    if missing:
+        raise RuntimeError(f"{module_name} is missing benchmark targets: {', '.join(missing)}")
+    return module
+
+def _sample_names(count, seed=0):
+    rng = random.Random(seed)
+    parts = ["arm", "forearm", "hand", "finger_01", "thigh", "shin", "foot", "eye", "lid_upper", "brow", "cheek", "lip_corner"]
+    forms = ["{p}.L", "{p}.R", "{p}_l", "{p}_r", "L_{p}", "R_{p}", "CTRL_{p}.L", "DEF_{p}-R", "{p}", "MCH_{p}.001"]
+    return [rng.choice(forms).format(p=f"{rng.choice(parts)}_{i}") for i in range(count)]
+
+def run_micro(repeat=5, count=20_000):
+    irt = load_addon(RIG_TOOLS_MODULE)
+    mc = load_addon(MESH_CODING_MODULE)
+    names = _sample_names(count)
+    paths = [f'pose.bones["{n}"].location' if i % 2 else f'pose.bones["{n}"]["{names[-i]}"]' for i, n in enumerate(names)]
+    results = {}
+
+    flip_token, clear = irt._flip_token, irt.clear_flip_cache
+    results["flip_token.uncached"] = measure(lambda: [flip_token.__wrapped__(n) for n in names], repeat, items=count)
+    results["flip_token.cold_cache"] = measure(lambda: [flip_token(n) for n in names], repeat, setup=clear, items=count)
+    results["flip_token.warm_cache"] = measure(lambda: [flip_token(n) for n in names], repeat, items=count)
+    universal = irt.flip_path_universal
+    results["flip_path_universal.cold_cache"] = measure(lambda: [universal(p) for p in paths], repeat, setup=clear, items=count)
+    results["flip_path_universal.warm_cache"] = measure(lambda: [universal(p) for p in paths], repeat, items=count)
+    results["flip_data_path.cold_cache"] = measure(lambda: irt.flip_batch(paths, paths=True), repeat, setup=clear, items=count)
+    results["flip_data_path.warm_cache"] = measure(lambda: irt.flip_batch(paths, paths=True), repeat, items=count)
+    results["strip_side"] = measure(lambda: [irt.strip_side(n) for n in names], repeat, items=count)
+    results["path_side"] = measure(lambda: [irt.path_side(p) for p in paths], repeat, items=count)
+    results["compose_name"] = measure(lambda: [irt.compose_name(n, "CTRL_", ".L", "arm", "limb") for n in names], repeat, items=count)
+
+    expressions = ["var*1.0 + var_001*1.0", "(var + var_001) / 2", "math.sin(var) * math.pi + 2**3",
+                   "max(var, var_001)", "var if var_001 > 0.5 else -var", "radians(90) * var - 0"] * (count // 60)
+    var_names = ["var", "var_001"]
+    results["optimize_expression"] = measure(
+        lambda: [irt.optimize_expression(e, var_names) for e in expressions], repeat, items=len(expressions))
+    results["expressions_equivalent"] = measure(
+        lambda: [irt.expressions_equivalent(e, e, 'SCRIPTED', var_names, 16) for e in expressions[:600]], repeat, items=600)
+
+    np = irt.np
+    x = np.linspace(0.0, 100.0, 10_000)
+    y = np.sin(x) + 0.01 * np.random.default_rng(0).standard_normal(len(x))
+    results["rdp_keep_mask.10k"] = measure(lambda: irt.rdp_keep_mask(x, y, 0.02), repeat, items=len(x))
+    results.update(_micro_mesh_coding(mc, np, repeat))
+    return results
+
+def _micro_mesh_coding(mc, np, repeat, verts=200_000):
+    rng = np.random.default_rng(0)
+    coords = rng.standard_normal(verts * 3).astype("<f4")
+    edges = np.column_stack((np.arange(verts), (np.arange(verts) + 1) % verts)).astype("<i4").ravel()
+    results = {"geometry_hash.200k": measure(lambda: mc.geometry_hash(coords, edges), repeat, items=verts)}
+
+    header = mc._BINARY_HEADER.pack(mc.BINARY_MAGIC, mc.BINARY_VERSION, 0, verts, verts, 0, 0)
+    buffer = header + coords.tobytes() + edges.tobytes()
+    results["binary_arrays.200k"] = measure(lambda: mc._binary_arrays(buffer), repeat, items=verts)
+
+    fd, path = tempfile.mkstemp(suffix=".json")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump({"vertex_count": verts, "edge_count": verts,
+                       "vertices": coords.reshape(-1, 3).tolist(), "edges": edges.reshape(-1, 2).tolist()}, f)
+        results["read_json_arrays.200k"] = measure(lambda: mc.read_json_arrays(path), repeat, items=verts)
+    finally:
+        os.remove(path)
+    return results
+
+# ---- Blender benchmarks ----
+
+def build_rig(bpy, bone_count, driver_count, keyframes=DRIVER_KEYFRAMES):
+    import numpy as np
+    arm = bpy.data.armatures.new("BENCH_rig")
+    obj = bpy.data.objects.new("BENCH_rig", arm)
+    bpy.context.scene.collection.objects.link(obj)
+    bpy.context.view_layer.objects.active = obj
+    bpy.ops.object.mode_set(mode='EDIT')
+    names = []
+    for i in range(bone_count // 2):
+        for side, x in (("L", 1.0), ("R", -1.0)):
+            bone = arm.edit_bones.new(f"bone_{i:05d}.{side}")
+            bone.head = (x * (1 + i % 50) * 0.1, 0.0, (i // 50) * 0.1)
+            bone.tail = (bone.head[0], 0.0, bone.head[2] + 0.05)
+            names.append(bone.name)
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    # Nine driven channels per bone; targets mix Transform Channel and Single Property on mirrored bones,
+    # expressions mix simple and Python-only forms.
+    channels = [(prop, index) for prop in ("location", "rotation_euler", "scale") for index in range(3)]
+    xs = np.linspace(-1.0, 1.0, keyframes, dtype=np.float32)
+    co = np.column_stack((xs, xs ** 3)).ravel()
+    fcurves = []
+    for j in range(driver_count):
+        name = names[(j // len(channels)) % len(names)]
+        prop, index = channels[j % len(channels)]
+        fc = obj.driver_add(f'pose.bones["{name}"].{prop}', index)
+        for mod in list(fc.modifiers):
+            fc.modifiers.remove(mod)
+        driver = fc.driver
+        driver.type = 'SCRIPTED'
+        other = name[:-1] + ("R" if name.endswith("L") else "L")
+        var = driver.variables.new()
+        var.name = "var"
+        var.type = 'TRANSFORMS'
+        var.targets[0].id = obj
+        var.targets[0].bone_target = other
+        var.targets[0].transform_type = 'LOC_X'
+        prop_var = driver.variables.new()
+        prop_var.name = "var_001"
+        prop_var.type = 'SINGLE_PROP'
+        prop_var.targets[0].id = obj
+        prop_var.targets[0].data_path = f'pose.bones["{other}"].location[1]'
+        driver.expression = ("var", "var * 2 + var_001", "math.sin(var) + var_001 ** 2")[j % 3]
+        fc.keyframe_points.add(keyframes)
+        fc.keyframe_points.foreach_set("co", co)
+        fc.update()
+        fcurves.append(fc)
+    return obj, names, fcurves
+
+def build_widget(mc, verts):
+    import numpy as np
+    rng = np.random.default_rng(0)
+    coords = rng.standard_normal(verts * 3).astype(np.float32)
+    edges = np.column_stack((np.arange(verts), (np.arange(verts) + 1) % verts)).astype(np.int32).ravel()
+    return mc.mesh_from_arrays("BENCH_widget", coords, edges)
+
+def run_blender(bone_count, driver_count, verts, repeat=3):
+    import bpy
+    irt = load_addon(RIG_TOOLS_MODULE)
+    mc = load_addon(MESH_CODING_MODULE)
+    results = {}
+
+    rig = []
+    results["build.synthetic_rig"] = measure(lambda: rig.append(build_rig(bpy, bone_count, driver_count)), 1, items=driver_count)
+    obj, names, fcurves = rig[0]
+
+    def flip_each():
+        index = irt.DriverFlipIndex()
+        index.bone_names(obj)
+        for fc in fcurves:
+            irt.flip_driver_targets(fc.driver, index)
+    results["flip_driver"] = measure(flip_each, repeat, setup=irt.clear_flip_cache, items=len(fcurves))
+    results["flip_all_drivers"] = measure(lambda: irt.flip_drivers([obj]), repeat, setup=irt.clear_flip_cache, items=len(fcurves))
+    results["invert_driver"] = measure(lambda: [irt.invert_fcurve_keys(fc, 'CURVE_ZERO') for fc in fcurves], repeat, items=len(fcurves))
+    modes = ["LINEAR", "BEZIER"]
+    def convert_all():
+        modes.reverse()
+        for fc in fcurves:
+            irt.convert_fcurve_keys(fc, modes[0], 'AUTO_CLAMPED')
+    results["convert_driver_curve"] = measure(convert_all, repeat, items=len(fcurves))
+    results["find_drivers.file"] = measure(lambda: irt.find_drivers(None, "*location*"), repeat, items=len(fcurves))
+    results["scan_drivers"] = measure(irt.scan_drivers, repeat, items=len(fcurves))
+
+    # Live Parenting deferred commit: each bone of a side parented to the previous one.
+    bpy.ops.object.mode_set(mode='EDIT')
+    left = [n for n in names if n.endswith(".L")]
+    chain = types.SimpleNamespace(chain=dict(zip(left[1:], left[:-1])))
+    def unparent():
+        for bone in obj.data.edit_bones:
+            bone.parent = None
+    results["live_parenting_commit"] = measure(
+        lambda: irt.INFAME_OT_live_parenting.commit_chain(chain, bpy.context), repeat, setup=unparent, items=len(chain.chain))
+    bpy.ops.object.mode_set(mode='OBJECT')
+
+    widget = build_widget(mc, verts)
+    workdir = tempfile.mkdtemp(prefix="infame_bench_")
+    json_path = os.path.join(workdir, "widget.json")
+    binary_path = os.path.join(workdir, "widget" + mc.BINARY_EXT)
+    created = []
+    def cleanup():
+        while created:
+            bpy.data.meshes.remove(created.pop())
+    results["mesh_export_json"] = measure(lambda: mc.write_mesh_json(json_path, widget, pretty=True), repeat, items=verts)
+    results["mesh_export_json.compact"] = measure(lambda: mc.write_mesh_json(json_path, widget, pretty=False), repeat, items=verts)
+    results["mesh_export_binary"] = measure(lambda: mc.write_mesh_binary(binary_path, widget), repeat, items=verts)
+    results["mesh_import_json"] = measure(lambda: created.append(mc.read_mesh_json(json_path, "BENCH_in")), repeat, teardown=cleanup, items=verts)
+    results["mesh_import_binary"] = measure(lambda: created.append(mc.read_mesh_binary(binary_path, "BENCH_in")), repeat, teardown=cleanup, items=verts)
+    results["mesh_geometry_hash"] = measure(lambda: mc.mesh_geometry_hash(widget), repeat, items=verts)
+    for path in (json_path, binary_path):
+        os.remove(path)
+    os.rmdir(workdir)
+    return results, bpy.app.version_string
+
+# ---- Comparison ----
+
+def compare(baseline_path, current_path, threshold=DEFAULT_THRESHOLD, metric="median"):
+    with open(baseline_path, 'r') as f:
+        baseline = json.load(f)["results"]
+    with open(current_path, 'r') as f:
+        current = json.load(f)["results"]
+    regressions = []
+    print(f"{'benchmark':40} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for name in sorted(set(baseline) | set(current)):
+        if name not in baseline or name not in current:
+            print(f"{name:40} {'only in ' + ('current' if name in current else 'baseline'):>34}")
+            continue
+        old, new = baseline[name][metric], current[name][metric]
+        change = (new - old) / old if old else 0.0
+        flag = "REGRESSION" if change > threshold else ("faster" if change < -threshold else "")
+        if flag == "REGRESSION":
+            regressions.append(name)
+        print(f"{name:40} {old * 1000:12.3f} {new * 1000:12.3f} {change:+8.1%} {flag}")
+    print(f"{len(regressions)} regressions beyond {threshold:.0%}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Infame Rig Tools / Mesh Coding benchmarks.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    micro = sub.add_parser("micro", help="Pure-Python micro-benchmarks, no Blender needed")
+    micro.add_argument("--out", default="bench_micro.json")
+    micro.add_argument("--repeat", type=int, default=5)
+    micro.add_argument("--count", type=int, default=20_000, help="Names and paths per benchmark")
+    blender = sub.add_parser("blender", help="Synthetic rig and mesh benchmarks, run inside blender --background")
+    blender.add_argument("--out", default="bench_blender.json")
+    blender.add_argument("--repeat", type=int, default=3)
+    blender.add_argument("--scale", choices=sorted(SCALES), default="small")
+    blender.add_argument("--bones", type=int)
+    blender.add_argument("--drivers", type=int)
+    blender.add_argument("--verts", type=int)
+    cmp = sub.add_parser("compare", help="Compare two result files and flag regressions")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown as a fraction (0.15 = 15%%)")
+    cmp.add_argument("--metric", choices=("min", "median", "mean"), default="median")
+    args = parser.parse_args(argv)
+
+    if args.command == "micro":
+        _write_results(args.out, _meta("micro", count=args.count), run_micro(args.repeat, args.count))
+    elif args.command == "blender":
+        sizes = dict(SCALES[args.scale])
+        sizes.update({key: getattr(args, key) for key in sizes if getattr(args, key)})
+        results, version = run_blender(sizes["bones"], sizes["drivers"], sizes["verts"], args.repeat)
+        _write_results(args.out, _meta("blender", blender=version, scale=args.scale, **sizes), results)
+    else:
+        return 1 if compare(args.baseline, args.current, args.threshold, args.metric) else 0
+    return 0
+
+if __name__ == "__main__":
+    # Inside Blender the script's own arguments follow "--".
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else None
+    sys.exit(main(argv))
@@ -0,0 +1,19 @@
+import os
+import sys
+
+import pytest
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets")
+sys.path.insert(0, ASSETS_DIR)
+
+from infame_bench import load_addon  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def rig_tools():
+    return load_addon("InfameRigsTools_0_3_6")
+
+
+@pytest.fixture(scope="session")
+def mesh_coding():
+    return load_addon("Mesh_Coding_0_3")
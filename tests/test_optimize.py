@@ -0,0 +1,19 @@
+import pytest
+
+
+def test_constant_powers_are_folded(rig_tools):
+    assert rig_tools.optimize_expression("var * 2**3", ["var"]) == ("var * 8", 'SCRIPTED')
+
+
+def test_huge_constant_power_is_rejected(rig_tools):
+    with pytest.raises(rig_tools.ExpressionNotSimple):
+        rig_tools.optimize_expression("var * 9**9**9", ["var"])
+
+
+def test_fractional_power_skips_complex_samples(rig_tools):
+    assert rig_tools.optimize_expression("var ** 0.5", ["var"]) == ("pow(var, 0.5)", 'SCRIPTED')
+    assert rig_tools.expressions_equivalent("var ** 0.5", "pow(var, 0.5)", 'SCRIPTED', ["var"])
+
+
+def test_expression_that_never_evaluates_is_not_equivalent(rig_tools):
+    assert not rig_tools.expressions_equivalent("sin(a, b)", "sin(a, b)", 'SCRIPTED', ["a", "b"])
@@ -0,0 +1,76 @@
+class Item:
+    def __init__(self, name):
+        self.name = name
+
+
+def namespace(*names):
+    return {name: Item(name) for name in names}
+
+
+def test_chained_rename_onto_existing_name_drops_whole_chain(rig_tools):
+    items = namespace("A", "B", "C")
+    changes = {"A": "B", "B": "C"}
+    skipped = rig_tools.apply_renames(items, changes)
+    assert changes == {}
+    assert skipped == 2
+    assert [item.name for item in items.values()] == ["A", "B", "C"]
+
+
+def test_chained_rename_into_free_name(rig_tools):
+    items = namespace("A", "B")
+    changes = {"A": "B", "B": "C"}
+    assert rig_tools.apply_renames(items, changes) == 0
+    assert changes == {"A": "B", "B": "C"}
+    assert items["A"].name == "B" and items["B"].name == "C"
+
+
+def test_swap(rig_tools):
+    items = namespace("hand.L", "hand.R")
+    changes = {"hand.L": "hand.R", "hand.R": "hand.L"}
+    assert rig_tools.apply_renames(items, changes) == 0
+    assert items["hand.L"].name == "hand.R" and items["hand.R"].name == "hand.L"
+
+
+def test_duplicate_target_keeps_first(rig_tools):
+    changes = {"A": "X", "B": "X"}
+    assert rig_tools.filter_renames({"A", "B"}, changes) == 1
+    assert changes == {"A": "X"}
+
+
+def test_linked_renames_are_dropped_together(rig_tools):
+    changes = {"arm.L": "arm_L", "arm.R": "arm_R"}
+    linked = {"arm.L": "arm.R", "arm.R": "arm.L"}
+    assert rig_tools.filter_renames({"arm.L", "arm.R", "arm_R"}, changes, linked) == 2
+    assert changes == {}
+
+
+class Pointer:
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+    def as_pointer(self):
+        return id(self)
+
+
+def rewrite_path(rig_tools, path, renames, blender_fixed):
+    owner = Pointer()
+    fcurve = Pointer(data_path=path)
+    index = rig_tools.NameReferenceIndex()
+    index.add_path(owner, fcurve, "data_path")
+    if blender_fixed:
+        fcurve.data_path = blender_fixed
+    index.rewrite([owner], "bones", renames)
+    return fcurve.data_path
+
+
+def test_swap_rewrites_path_from_indexed_value(rig_tools):
+    renames = {"A": "B", "B": "A"}
+    assert rewrite_path(rig_tools, 'pose.bones["A"].location', renames, None) == 'pose.bones["B"].location'
+    assert rewrite_path(rig_tools, 'pose.bones["A"].location', renames, 'pose.bones["B"].location') == 'pose.bones["B"].location'
+
+
+def test_chain_rewrites_path_from_indexed_value(rig_tools):
+    renames = {"A": "B", "B": "C"}
+    assert rewrite_path(rig_tools, 'pose.bones["A"].location', renames, None) == 'pose.bones["B"].location'
+    assert rewrite_path(rig_tools, 'pose.bones["A"].location', renames, 'pose.bones["B"].location') == 'pose.bones["B"].location'
+    assert rewrite_path(rig_tools, 'pose.bones["B"].location', renames, 'pose.bones["C"].location') == 'pose.bones["C"].location'
@@ -0,0 +1,27 @@
+import pytest
+
+
+def test_truncated_binary_file_is_a_value_error(mesh_coding, tmp_path):
+    path = tmp_path / "short.mcsh"
+    path.write_bytes(mesh_coding.BINARY_MAGIC)
+    with pytest.raises(ValueError):
+        mesh_coding.load_shape_arrays(str(path))
+
+
+@pytest.mark.parametrize("text", [
+    '{"vertices": [[0, 0, 0], [1, 1]], "edges": []}',
+    '{"vertices": [[0, 0, 0], [1, 1, 1]], "edges": [[0, 1, 1]]}',
+    '{"vertices": [[0, 0, 0], [1, 1, 1]], "edges": [[0, 2]]}',
+])
+def test_malformed_json_rows_are_rejected(mesh_coding, tmp_path, text):
+    path = tmp_path / "bad.json"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        mesh_coding.load_shape_arrays(str(path))
+
+
+def test_valid_json_shape_loads(mesh_coding, tmp_path):
+    path = tmp_path / "line.json"
+    path.write_text('{"vertices": [[0, 0, 0], [1, 1, 1]], "edges": [[0, 1]]}')
+    coords, edges, _face_sizes, _loops = mesh_coding.load_shape_arrays(str(path))
+    assert len(coords) == 6 and list(edges) == [0, 1]